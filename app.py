@@ -1,12 +1,23 @@
 import streamlit as st
+import os
 import sys
+import time
 sys.path.append('.')
 
+# Not: openpyxl/pyarrow (DataExporter) ve numpy/scikit-learn (UserClusterer,
+# near_duplicates) burada import edilmez; yalnızca Export/AI sekmesi veya
+# arama gerçekten çalıştığında yüklenir. Ölçüm: python -m utils.perf
 from utils.api_client import JSearchClient
+from utils.rate_limit import RateLimitExceeded
 from utils.user_manager import UserManager, create_user_profile_template
 from ml.recommender import JobRecommender
-from utils.data_export import DataExporter
-from ml.user_clustering import UserClusterer
+from ml.recommendation_cache import RecommendationCache, job_set_version
+from utils.prefetch import PrefetchScheduler
+from utils.job_catalog import JobCatalog
+from utils.job_search import JobSearchIndex, LocalFirstSearch
+from utils.facets import FACET_LABELS
+from utils.result_cache import SharedResultCache, search_key
+from utils.search_tasks import SearchRunner
 
 # Sayfa ayarları
 st.set_page_config(
@@ -20,15 +31,209 @@ if 'logged_in' not in st.session_state:
     st.session_state.logged_in = False
 if 'user_email' not in st.session_state:
     st.session_state.user_email = None
-if 'jobs_cache' not in st.session_state:
-    st.session_state.jobs_cache = []
+# Sonuçların kendisi paylaşılan önbellekte; oturum yalnızca anahtarı ve id'leri tutar
+if 'jobs_handle' not in st.session_state:
+    st.session_state.jobs_handle = None
+if 'jobs_ids' not in st.session_state:
+    st.session_state.jobs_ids = []
+if 'search_task' not in st.session_state:
+    st.session_state.search_task = None  # Arka planda süren arama
+if 'search_notice' not in st.session_state:
+    st.session_state.search_notice = None  # Son aramanın bilgi/uyarı mesajı
+if 'jobs_version' not in st.session_state:
+    st.session_state.jobs_version = None
+if 'jobs_page' not in st.session_state:
+    st.session_state.jobs_page = 0  # Sonuç listesindeki sayfa imleci
+if 'jobs_filter_key' not in st.session_state:
+    st.session_state.jobs_filter_key = None
 
-# Managers
-user_manager = UserManager()  
-api_client = JSearchClient()
-recommender = JobRecommender()
-exporter = DataExporter()
-clusterer = UserClusterer(n_clusters=3)
+PAGE_SIZES = [10, 20, 50]
+
+USERS_FILE = "data/users.json"
+
+# Managers: her rerun'da değil, süreç başına bir kez oluşturulur
+@st.cache_resource(max_entries=1)
+def get_user_manager(users_mtime):
+    """Kullanıcı dosyası dışarıda (ör. cli.py import-students) değişince yeniden yüklenir"""
+    return UserManager(USERS_FILE)
+
+def current_user_manager():
+    mtime = os.path.getmtime(USERS_FILE) if os.path.exists(USERS_FILE) else 0
+    return get_user_manager(mtime)
+
+@st.cache_resource
+def get_api_client():
+    return JSearchClient()
+
+@st.cache_resource
+def get_recommender():
+    return JobRecommender()
+
+@st.cache_resource
+def get_recommendation_cache():
+    """Oturumlar arası öneri önbelleği; profil güncellenince kullanıcının kayıtları silinir"""
+    cache = RecommendationCache()
+    UserManager.profile_listeners.append(cache.invalidate_user)
+    return cache
+
+@st.cache_resource
+def get_result_cache():
+    """Aynı aramayı yapan oturumlar sonuçların tek kopyasını paylaşır"""
+    return SharedResultCache()
+
+@st.cache_resource
+def get_search_runner():
+    """Aramalar betik thread'ini bloklamasın diye arka plan havuzu"""
+    return SearchRunner()
+
+@st.cache_resource
+def get_exporter():
+    """Export kütüphaneleri (openpyxl, pyarrow) yalnızca ilk export isteğinde yüklenir"""
+    from utils.data_export import DataExporter
+    return DataExporter()
+
+user_manager = current_user_manager()
+api_client = get_api_client()
+recommender = get_recommender()
+recommendation_cache = get_recommendation_cache()
+result_cache = get_result_cache()
+
+@st.cache_resource
+def get_prefetcher():
+    """Popüler aramaları arka planda tazeleyen zamanlayıcı (süreç başına bir tane)"""
+    return PrefetchScheduler(get_api_client()).start()
+
+get_prefetcher()
+
+@st.cache_resource
+def get_cluster_worker():
+    """Kümelemeyi arka planda yapan işçi; scikit-learn yalnızca işçi thread'inde yüklenir"""
+    from ml.cluster_worker import ClusteringWorker
+    # İşçinin kendi örneği; snapshot_users dosya değiştiyse yeniden yükler
+    return ClusteringWorker(UserManager(USERS_FILE).snapshot_users, n_clusters=3).start()
+
+CATALOG_FILE = "data/job_catalog.json"
+
+@st.cache_resource(max_entries=1)
+def get_search_index(catalog_mtime):
+    """Yerel katalog üzerinde BM25 indeksi (katalog dosyası değişince yeniden kurulur, eskisi bırakılır)"""
+    catalog = JobCatalog(CATALOG_FILE)
+    if not catalog.jobs:
+        catalog.ingest_local_file("data/jobs.json")
+    return JobSearchIndex(catalog.get_active_jobs())
+
+def current_search_index():
+    mtime = os.path.getmtime(CATALOG_FILE) if os.path.exists(CATALOG_FILE) else 0
+    return get_search_index(mtime)
+
+def attach_results(key, entry):
+    """Oturumu paylaşılan sonuç kaydına bağla (önceki kaydın referansı bırakılır)"""
+    
+    old_key = st.session_state.jobs_handle
+    if old_key != key:
+        if old_key:
+            result_cache.release(old_key)
+        result_cache.acquire(key)
+    
+    st.session_state.jobs_handle = key
+    st.session_state.jobs_ids = list(entry['ids'])
+    st.session_state.jobs_version = job_set_version(entry['jobs'][job_id] for job_id in entry['ids'])
+    st.session_state.jobs_page = 0
+    
+    # Yeni arama: kullanıcının eski ilan kümesine ait önerileri bırak
+    if st.session_state.user_email:
+        recommendation_cache.invalidate_user(st.session_state.user_email)
+
+def use_shared_results(key):
+    """Aynı arama başka bir oturumda yapıldıysa onun sonucunu kullan"""
+    entry = result_cache.lookup(key)
+    if entry is None:
+        return False
+    attach_results(key, entry)
+    return True
+
+def set_search_results(key, jobs, provenance=None):
+    """Arama sonuçlarını paylaşılan önbelleğe yaz; facet sayaçları bir kez burada hesaplanır"""
+    from ml.near_duplicates import collapse_duplicates
+    
+    # Farklı panolardan gelen aynı ilanları tek kayda indir
+    jobs = collapse_duplicates(jobs)
+    attach_results(key, result_cache.put(key, jobs, provenance))
+
+def start_search(key, label, fn):
+    """Aramayı arka planda başlat; oturumun önceki araması iptal edilir
+
+    fn(task) -> (ilanlar, köken, bilgi mesajı) döndürür ve Streamlit'e dokunmaz.
+    """
+    previous = st.session_state.search_task
+    if previous is not None and not previous.done():
+        previous.cancel()
+    st.session_state.search_task = None
+    
+    if use_shared_results(key):
+        st.session_state.search_notice = ("caption", "⚡ Aynı arama az önce yapıldı, sonuçlar paylaşılan önbellekten geldi")
+        return
+    
+    st.session_state.search_notice = None
+    st.session_state.search_task = get_search_runner().submit(key, fn, label)
+
+@st.fragment(run_every=0.5)
+def search_progress():
+    """Süren aramayı yokla: ara sonuçları göster, bitince sonuçları yaz ve sayfayı yenile"""
+    task = st.session_state.search_task
+    if task is None:
+        return
+    
+    if not task.done():
+        st.info(f"⏳ {task.label} — {len(task.partial)} ilan yüklendi ({task.elapsed():.0f} sn)")
+        for job in task.partial[-3:]:
+            st.caption(f"📌 {job['title']} — {job['company']}")
+        if st.button("✖ Aramayı iptal et"):
+            task.cancel()
+            st.session_state.search_task = None
+            st.rerun()
+        return
+    
+    st.session_state.search_task = None
+    try:
+        jobs, provenance, notice = task.result()
+        set_search_results(task.key, jobs, provenance)
+        if not jobs:
+            notice = ("warning", "⚠️ API'den boş liste döndü. Anahtarını kontrol et!")
+        st.session_state.search_notice = notice
+    except RateLimitExceeded as e:
+        st.session_state.search_notice = ("warning", f"⏳ Çok fazla istek var, {e.retry_after:.0f} sn sonra tekrar deneyin.")
+    except Exception as e:
+        st.session_state.search_notice = ("error", f"❌ API Hatası: {e}")
+    st.rerun()
+
+def current_results():
+    """Oturumun sonuç kaydı; kayıt önbellekten atıldıysa oturum sıfırlanır"""
+    key = st.session_state.jobs_handle
+    entry = result_cache.get(key) if key else None
+    if key and entry is None:
+        st.session_state.jobs_handle = None
+        st.session_state.jobs_ids = []
+    return entry
+
+def current_jobs():
+    """Oturumun arama sonuçları (sıra korunur)"""
+    if current_results() is None:
+        return []
+    return result_cache.get_jobs(st.session_state.jobs_handle, st.session_state.jobs_ids) or []
+
+def page_window(items, page, page_size):
+    """Listenin sayfa dilimi; sayfa numarası geçerli aralığa çekilir
+
+    (sayfadaki öğeler, düzeltilmiş sayfa, toplam sayfa) döndürür.
+    """
+    total_pages = max(1, -(-len(items) // page_size))
+    page = min(max(page, 0), total_pages - 1)
+    start = page * page_size
+    return items[start:start + page_size], page, total_pages
+
+def move_page(step):
+    st.session_state.jobs_page += step
 
 def login_page():
     """Giriş/Kayıt sayfası"""
@@ -135,34 +340,147 @@ def main_app():
     with tab1:
         st.header("İş İlanları")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         with col1:
             search_query = st.text_input("Arama", value="student part time")
         with col2:
             location = st.text_input("Konum", value="Turkey")
         with col3:
             date_filter = st.selectbox("Zaman", ["today", "3days", "week", "month", "all"])
+        with col4:
+            num_pages = st.number_input("Sayfa", min_value=1, max_value=5, value=1)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            employment_filter = st.selectbox("Çalışma Tipi",
+                                             ["Hepsi", "PARTTIME", "FULLTIME", "CONTRACTOR", "INTERN"])
+        with col2:
+            remote_only = st.checkbox("🏠 Sadece remote")
         
         if st.button("🔍 Ara", type="primary"):
-            st.info("🚀 Buton tetiklendi, API'ye gidiliyor...")
-            with st.spinner("İş ilanları aranıyor..."):
-                try:
-                    jobs = api_client.search_jobs(
-                        query=search_query,
-                        location=location,
-                        num_pages=1,
-                        date_posted=date_filter
+            key = search_key(
+                kind="local_first",
+                query=search_query,
+                location=location,
+                date_posted=date_filter,
+                employment_type=employment_filter,
+                remote=remote_only,
+                num_pages=int(num_pages)
+            )
+            
+            # Önce yerel katalog; sonuç azsa API sayfaları paralel gelir
+            search = LocalFirstSearch(current_search_index(), api_client)
+            search_args = dict(
+                query=search_query,
+                location=location,
+                date_posted=date_filter,
+                employment_type=None if employment_filter == "Hepsi" else employment_filter,
+                remote=True if remote_only else None,
+                num_pages=int(num_pages)
+            )
+            
+            def run_search(task):
+                throttled = []
+                jobs, source = search.search(
+                    **search_args,
+                    on_job=lambda loaded: setattr(task, "partial", list(loaded)),
+                    cancel=task.cancelled,
+                    throttled=throttled
+                )
+                notice = ("caption", "⚡ Sonuçlar yerel katalogdan geldi") if source == "local" else None
+                if throttled:
+                    notice = ("warning", f"⏳ {len(throttled)} sayfa hız sınırına takıldı, sonuçlar eksik olabilir.")
+                return jobs, {}, notice
+            
+            start_search(key, f"'{search_query}' aranıyor", run_search)
+        
+        with st.expander("🔀 Çoklu Arama (birden fazla sorgu ve şehir)"):
+            multi_queries = st.text_area("Sorgular (her satıra bir tane)",
+                                         value="part time\ninternship\nstajyer")
+            multi_locations = st.multiselect("Şehirler",
+                                             ["Istanbul", "Ankara", "Izmir", "Bursa", "Antalya"],
+                                             default=["Istanbul", "Ankara", "Izmir"])
+            
+            if st.button("🔀 Hepsini Ara"):
+                queries = [q.strip() for q in multi_queries.splitlines() if q.strip()]
+                pairs = [(q, f"{loc}, Turkey") for q in queries for loc in multi_locations]
+                key = search_key(kind="multi", pairs=pairs, num_pages=int(num_pages), date_posted=date_filter)
+                
+                def run_multi_search(task):
+                    throttled = []
+                    jobs, provenance = api_client.search_many(
+                        pairs,
+                        num_pages=int(num_pages),
+                        date_posted=date_filter,
+                        throttled=throttled
                     )
-                    st.session_state.jobs_cache = jobs
-                    if not jobs:
-                        st.warning("⚠️ API'den boş liste döndü. Anahtarını kontrol et!")
-                except Exception as e:
-                    st.error(f"❌ API Hatası: {e}")
-                    
-        if st.session_state.jobs_cache:
-            st.success(f"✅ {len(st.session_state.jobs_cache)} ilan bulundu!")
+                    notice = None
+                    if throttled:
+                        skipped = ", ".join(f"{t['query']} / {t['location']}" for t in throttled)
+                        notice = ("warning", f"⏳ Hız sınırına takılan aramalar atlandı: {skipped}")
+                    return jobs, provenance, notice
+                
+                start_search(key, f"{len(pairs)} arama paralel yapılıyor", run_multi_search)
+        
+        # Yoklama yalnızca süren bir arama varken çalışır
+        if st.session_state.search_task is not None:
+            search_progress()
+        
+        notice = st.session_state.search_notice
+        if notice:
+            kind, message = notice
+            getattr(st, kind)(message)
+        
+        results = current_results()
+        if results and results['ids']:
+            facets = results['facets']
             
-            for job in st.session_state.jobs_cache[:10]:
+            # Facet sayıları aramada hesaplandı; burada yalnızca küme kesişimi yapılır
+            with st.expander("🧭 Filtreler"):
+                selections = {}
+                facet_cols = st.columns(3)
+                for i, (facet, label) in enumerate(FACET_LABELS.items()):
+                    counts = facets.counts(facet)
+                    if not counts:
+                        continue
+                    with facet_cols[i % 3]:
+                        selections[facet] = st.multiselect(
+                            label,
+                            sorted(counts),
+                            format_func=lambda value, counts=counts: f"{value} ({counts[value]})",
+                            key=f"facet_{facet}"
+                        )
+            
+            if any(selections.values()):
+                visible_ids = facets.filter(selections)
+                visible_ids = [job_id for job_id in st.session_state.jobs_ids if job_id in visible_ids]
+            else:
+                visible_ids = st.session_state.jobs_ids
+            
+            # Filtre değişince ilk sayfaya dön
+            filter_key = tuple(sorted((facet, tuple(values)) for facet, values in selections.items()))
+            if filter_key != st.session_state.jobs_filter_key:
+                st.session_state.jobs_filter_key = filter_key
+                st.session_state.jobs_page = 0
+            
+            st.success(f"✅ {len(visible_ids)} ilan bulundu!")
+            
+            # Yalnızca görünen sayfanın widget'ları oluşturulur; sıra arama sonucundaki sıradır
+            page_size = st.selectbox("Sayfa başına ilan", PAGE_SIZES, key="jobs_page_size")
+            page_ids, page, total_pages = page_window(visible_ids, st.session_state.jobs_page, page_size)
+            st.session_state.jobs_page = page
+            
+            nav1, nav2, nav3 = st.columns([1, 2, 1])
+            with nav1:
+                st.button("◀ Önceki", on_click=move_page, args=(-1,), disabled=page == 0)
+            with nav2:
+                st.caption(f"Sayfa {page + 1} / {total_pages} "
+                           f"({page * page_size + 1}-{page * page_size + len(page_ids)} arası)")
+            with nav3:
+                st.button("Sonraki ▶", on_click=move_page, args=(1,), disabled=page >= total_pages - 1)
+            
+            # Yalnızca görünen sayfanın ilanları önbellekten çözülür
+            for job in result_cache.get_jobs(st.session_state.jobs_handle, page_ids) or []:
                 with st.expander(f"📌 {job['title']}"):
                     col1, col2 = st.columns([2, 1])
                     
@@ -172,9 +490,14 @@ def main_app():
                         st.write(f"**💼 Tür:** {job['employment_type']}")
                         st.write(f"**🏠 Remote:** {'✅' if job['is_remote'] else '❌'}")
                         
-                        if job['description']:
-                            with st.expander("📄 Açıklama"):
-                                st.write(job['description'][:500] + "...")
+                        matches = results['provenance'].get(job['id'])
+                        if matches:
+                            st.caption("🔎 Eşleşen aramalar: " + "; ".join(
+                                f"{m['query']} @ {m['location']}" for m in matches))
+                        
+                        # Açıklama metni yalnızca istenirse sayfaya gönderilir
+                        if job['description'] and st.toggle("📄 Açıklama", key=f"desc_{job['id']}"):
+                            st.write(job['description'][:500] + "...")
                     
                     with col2:
                         st.write(f"**💰 Maaş:**")
@@ -198,14 +521,21 @@ def main_app():
     with tab2:
         st.header("⭐ Size Özel İş Önerileri")
         
-        if not st.session_state.jobs_cache:
+        if not st.session_state.jobs_ids:
             st.info("👈 Önce 'İş Ara' sekmesinden iş araması yapın!")
         else:
+            # Profil ve ilan kümesi değişmedikçe rerun'lar önbellekten okur
             with st.spinner("AI öneriler hesaplanıyor..."):
-                recommendations = recommender.recommend_jobs(
+                recommendations = recommendation_cache.get_or_compute(
+                    st.session_state.user_email,
                     user['profile'],
-                    st.session_state.jobs_cache,
-                    top_n=10
+                    st.session_state.jobs_version,
+                    10,
+                    lambda: recommender.recommend_jobs(
+                        user['profile'],
+                        current_jobs(),
+                        top_n=10
+                    )
                 )
             
             st.success(f"✨ En uygun {len(recommendations)} iş bulundu!")
@@ -269,7 +599,7 @@ def main_app():
                     "Uzaktan Çalışma",
                     ["On-site", "Remote", "Hybrid", "No Preference"],
                     index=["On-site", "Remote", "Hybrid", "No Preference"].index(
-                        profile.get('remote_preference', 'No Preference')
+                        profile.get('remote_preference') or 'No Preference'
                     )
                 )
                 new_distance = st.number_input(
@@ -302,42 +632,52 @@ def main_app():
     
     with tab4:
         st.header("📊 Veri Export")
-        st.write("Verilerinizi CSV veya Excel formatında indirin")
+        st.write("Verilerinizi CSV, Parquet veya Excel formatında indirin")
+        
+        # Parquet: tipli kolonlar (liste, zaman, boş bırakılabilir sayılar), pandas'a hızlı yüklenir
+        export_format = st.radio("Format", ["CSV", "Parquet"], horizontal=True)
+        if export_format == "CSV":
+            file_ext, mime = "csv", 'text/csv'
+        else:
+            file_ext, mime = "parquet", 'application/vnd.apache.parquet'
         
         col1, col2, col3 = st.columns(3)
         
+        # Dosyalar bellekte üretilir ve doğrudan indirilir; diske hiçbir şey yazılmaz
         with col1:
             st.subheader("👥 Kullanıcılar")
-            if st.button("📥 Kullanıcıları CSV'ye Aktar"):
+            if st.button(f"📥 Kullanıcıları {export_format}'e Aktar"):
                 try:
-                    filename = exporter.export_users_to_csv(user_manager.users)
-                    
-                    with open(filename, 'rb') as f:
-                        st.download_button(
-                            label="⬇️ CSV İndir",
-                            data=f,
-                            file_name=filename,
-                            mime='text/csv'
-                        )
-                    st.success(f"✅ {filename} oluşturuldu!")
+                    exporter = get_exporter()
+                    if export_format == "CSV":
+                        data = exporter.users_csv(user_manager.users)
+                    else:
+                        data = exporter.users_parquet(user_manager.iter_users())
+                    st.download_button(
+                        label=f"⬇️ {export_format} İndir",
+                        data=data,
+                        file_name=exporter.filename("users_export", file_ext),
+                        mime=mime
+                    )
                 except Exception as e:
                     st.error(f"Hata: {e}")
         
         with col2:
             st.subheader("💼 İş İlanları")
-            if st.session_state.jobs_cache:
-                if st.button("📥 İlanları CSV'ye Aktar"):
+            if st.session_state.jobs_ids:
+                if st.button(f"📥 İlanları {export_format}'e Aktar"):
                     try:
-                        filename = exporter.export_jobs_to_csv(st.session_state.jobs_cache)
-                        
-                        with open(filename, 'rb') as f:
-                            st.download_button(
-                                label="⬇️ CSV İndir",
-                                data=f,
-                                file_name=filename,
-                                mime='text/csv'
-                            )
-                        st.success(f"✅ {filename} oluşturuldu!")
+                        exporter = get_exporter()
+                        if export_format == "CSV":
+                            data = exporter.jobs_csv(current_jobs())
+                        else:
+                            data = exporter.jobs_parquet(current_jobs())
+                        st.download_button(
+                            label=f"⬇️ {export_format} İndir",
+                            data=data,
+                            file_name=exporter.filename("jobs_export", file_ext),
+                            mime=mime
+                        )
                     except Exception as e:
                         st.error(f"Hata: {e}")
             else:
@@ -347,19 +687,15 @@ def main_app():
             st.subheader("📊 Tümü (Excel)")
             if st.button("📥 Tüm Verileri Excel'e Aktar"):
                 try:
-                    filename = exporter.export_to_excel(
-                        user_manager.users,
-                        st.session_state.jobs_cache if st.session_state.jobs_cache else []
+                    st.download_button(
+                        label="⬇️ Excel İndir",
+                        data=get_exporter().excel_bytes(
+                            user_manager.users,
+                            current_jobs()
+                        ),
+                        file_name=get_exporter().filename("jobmatch_data_export", "xlsx"),
+                        mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
                     )
-                    
-                    with open(filename, 'rb') as f:
-                        st.download_button(
-                            label="⬇️ Excel İndir",
-                            data=f,
-                            file_name=filename,
-                            mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                        )
-                    st.success(f"✅ {filename} oluşturuldu!")
                 except Exception as e:
                     st.error(f"Hata: {e}")
         
@@ -372,7 +708,7 @@ def main_app():
             st.metric("Toplam Kullanıcı", len(user_manager.users))
         
         with col2:
-            st.metric("Toplam İlan", len(st.session_state.jobs_cache))
+            st.metric("Toplam İlan", len(st.session_state.jobs_ids))
         
         with col3:
             total_apps = sum(len(u.get('application_history', [])) 
@@ -386,12 +722,20 @@ def main_app():
         
         all_users = list(user_manager.users.values())
         
-        if len(all_users) >= 3:
-            with st.spinner("Kullanıcılar kümelere ayrılıyor..."):
-                clusterer.fit(all_users)
-                stats = clusterer.get_cluster_stats(all_users)
-            
-            st.success("✅ Kullanıcılar başarıyla kümelere ayrıldı!")
+        # Kümeleme arka planda yapılır; burada yalnızca son snapshot okunur
+        cluster_worker = get_cluster_worker()
+        snapshot = cluster_worker.snapshot
+        
+        if snapshot is None:
+            st.info("⏳ Kullanıcılar kümelere ayrılıyor, birazdan hazır olacak...")
+        
+        elif snapshot['stats']:
+            stats = snapshot['stats']
+            computed_at = time.strftime("%d.%m.%Y %H:%M", time.localtime(snapshot['computed_at']))
+            st.success(f"✅ {snapshot['user_count']} kullanıcı kümelere ayrıldı!")
+            st.caption(f"🕒 Son hesaplama: {computed_at}")
+            if st.button("🔄 Yeniden hesapla"):
+                cluster_worker.trigger()
             
             # Küme istatistikleri
             for cluster_name, cluster_info in stats.items():
@@ -416,20 +760,22 @@ def main_app():
             
             # Mevcut kullanıcının kümesi
             st.subheader("📍 Sizin Kümeniz")
-            my_cluster = clusterer.predict(user)
-            cluster_label = stats[f"Cluster {my_cluster}"]['label']
-            
-            st.info(f"Siz **{cluster_label}** grubundasınız!")
-            
-            # Benzer kullanıcılar
-            st.subheader("👥 Size Benzer Kullanıcılar")
-            similar_users = clusterer.find_similar_users(user, all_users, top_n=5)
+            my_cluster = cluster_worker.cluster_of(user['email'])
             
-            if similar_users:
-                for sim_user in similar_users:
-                    st.write(f"- {sim_user['name']} ({sim_user['email']})")
+            if my_cluster is None:
+                st.info("Profiliniz bir sonraki hesaplamada kümelere eklenecek.")
             else:
-                st.write("Şu anda sizinle aynı kümede başka kullanıcı yok.")
+                cluster_label = stats[f"Cluster {my_cluster}"]['label']
+                st.info(f"Siz **{cluster_label}** grubundasınız!")
+                
+                # Benzer kullanıcılar
+                st.subheader("👥 Size Benzer Kullanıcılar")
+                similar_users = [user_manager.get_user(email) for email in cluster_worker.similar_users(user['email'])]
+                if similar_users:
+                    for sim_user in similar_users:
+                        st.write(f"- {sim_user['name']} ({sim_user['email']})")
+                else:
+                    st.write("Şu anda sizinle aynı kümede başka kullanıcı yok.")
         
         else:
             st.warning("⚠️ Clustering için en az 3 kullanıcı gerekli!")
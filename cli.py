@@ -0,0 +1,245 @@
+"""JobMatch AI komut satırı (Streamlit olmadan, cron için)
+
+Örnekler:
+    python cli.py import-students
+    python cli.py sync-jobs --track "part time" --location "Istanbul, Turkey"
+    python cli.py score --top-n 10 --workers 4
+    python cli.py cluster --output exports/clusters.json
+    python cli.py export jobs --format parquet --incremental
+    python cli.py bench api --requests 100
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Ağır modüller (pandas, sklearn, pyarrow, openpyxl) yalnızca ilgili alt komutta yüklenir
+
+USERS_FILE = "data/users.json"
+CATALOG_FILE = "data/job_catalog.json"
+JOBS_FILE = "data/jobs.json"
+
+
+def _print(result):
+    print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+
+
+def _load_catalog(path: str):
+    """Katalog; boşsa yerel ilan dosyasıyla doldurulur ve kaydedilir
+
+    Kaydetmezsek her çalıştırma ilanları yeniden alır ve değişiklik
+    zamanları ilerler; artımlı export her seferinde tüm ilanları yazar.
+    """
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog(path)
+    if not catalog.jobs and os.path.exists(JOBS_FILE):
+        catalog.ingest_local_file(JOBS_FILE)
+        catalog.save()
+    return catalog
+
+
+def cmd_import_students(args) -> int:
+    from utils.user_manager import UserManager, profile_from_student
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        students = json.load(f)
+
+    manager = UserManager(args.users)
+    created = manager.create_users([
+        {"email": s["email"], "name": s.get("name", ""), "profile": profile_from_student(s)}
+        for s in students if s.get("email")
+    ])
+    _print({"students": len(students), "created": created, "skipped": len(students) - created})
+    return 0
+
+
+def cmd_sync_jobs(args) -> int:
+    from utils.api_client import JSearchClient
+    from utils.job_catalog import JobCatalog
+    from utils.job_sync import JobSync
+
+    sync = JobSync(JSearchClient(), JobCatalog(args.catalog), state_file=args.state)
+    for query in args.track or []:
+        sync.track(query, args.location)
+
+    if not sync.state["queries"]:
+        print("❌ Takip edilen sorgu yok (--track ile ekleyin)")
+        return 1
+
+    results = sync.sync_all()
+    _print(results)
+    # Başarısız sorguların durumu ilerlemez; cron hatayı çıkış koduyla görsün
+    return 1 if any("error" in result for result in results) else 0
+
+
+def cmd_score(args) -> int:
+    from ml.batch_recommend import BatchRecommender
+
+    batch = BatchRecommender(
+        users_file=args.users,
+        catalog_file=args.catalog,
+        jobs_file=JOBS_FILE,
+        output=args.output,
+        top_n=args.top_n,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        date_posted=args.date_posted,
+    )
+    _print(batch.run(resume=not args.restart))
+    return 0
+
+
+def cmd_cluster(args) -> int:
+    from ml.cluster_worker import ClusteringWorker
+    from utils.user_manager import UserManager
+
+    worker = ClusteringWorker(UserManager(args.users).snapshot_users, n_clusters=args.clusters)
+    if not worker.run_once(force=True):
+        return 1
+
+    snapshot = worker.snapshot
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2, default=str)
+
+    _print({
+        "user_count": snapshot["user_count"],
+        "clusters": snapshot["stats"],
+        "output": args.output,
+    })
+    return 0
+
+
+def cmd_export(args) -> int:
+    from utils.data_export import DataExporter
+    from utils.user_manager import UserManager
+
+    exporter = DataExporter(args.folder)
+    users = UserManager(args.users)
+    catalog = _load_catalog(args.catalog)
+    datasets = ["users", "jobs"] if args.dataset == "all" else [args.dataset]
+
+    if args.incremental:
+        from utils.incremental_export import IncrementalExporter
+
+        if args.format == "excel":
+            print("❌ Artımlı export yalnızca csv ve parquet destekler")
+            return 1
+
+        incremental = IncrementalExporter(exporter)
+        results = {}
+        for dataset in datasets:
+            # Pasifleşen ve tekrar işaretlenen ilanlar da değişikliktir, atlanmaz
+            records = (users.iter_users() if dataset == "users"
+                       else catalog.iter_jobs(active_only=False, include_duplicates=True))
+            results[dataset] = incremental.export(dataset, records, file_format=args.format,
+                                                  compress=args.gzip, full=args.full)
+        _print(results)
+        return 0
+
+    if args.format == "excel":
+        jobs = catalog.iter_jobs() if "jobs" in datasets else []
+        users_data = users.users if "users" in datasets else {}
+        _print({"excel": exporter.export_to_excel(users_data, jobs)})
+        return 0
+
+    paths = {}
+    for dataset in datasets:
+        if args.format == "parquet":
+            if dataset == "users":
+                paths[dataset] = exporter.export_users_to_parquet(users.iter_users())
+            else:
+                paths[dataset] = exporter.export_jobs_to_parquet(catalog.iter_jobs())
+        else:
+            extension = "csv.gz" if args.gzip else "csv"
+            filename = exporter.filename(f"{dataset}_export", extension)
+            if dataset == "users":
+                chunks = exporter.iter_users_csv(users.iter_users(), compress=args.gzip)
+            else:
+                chunks = exporter.iter_jobs_csv(catalog.iter_jobs(), compress=args.gzip)
+            paths[dataset] = exporter.write_stream(chunks, filename)
+
+    _print(paths)
+    return 0
+
+
+def cmd_bench(args) -> int:
+    if args.target == "api":
+        from utils.jsearch_stub import run_benchmark
+
+        _print(run_benchmark(requests_count=args.requests, workers=args.workers,
+                             latency=args.latency, error_rate=args.error_rate,
+                             cache_ttl=args.cache_ttl))
+        return 0
+
+    from utils.perf import cold_start_report
+
+    report = cold_start_report(args.budget_ms)
+    _print(report)
+    return 1 if report["problems"] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="JobMatch AI komut satırı")
+    parser.add_argument("--users", default=USERS_FILE, help="Kullanıcı dosyası")
+    parser.add_argument("--catalog", default=CATALOG_FILE, help="İlan kataloğu dosyası")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("import-students", help="Öğrenci kayıtlarını kullanıcı olarak içe aktar")
+    p.add_argument("--file", default="data/students.json")
+    p.set_defaults(func=cmd_import_students)
+
+    p = commands.add_parser("sync-jobs", help="Takip edilen sorguları JSearch ile senkronize et")
+    p.add_argument("--track", action="append", metavar="QUERY", help="Takibe eklenecek sorgu (tekrarlanabilir)")
+    p.add_argument("--location", default="Turkey")
+    p.add_argument("--state", default="data/sync_state.json")
+    p.set_defaults(func=cmd_sync_jobs)
+
+    p = commands.add_parser("score", help="Tüm kullanıcılar için toplu öneri üret")
+    p.add_argument("--output", default="exports/recommendations_batch.csv")
+    p.add_argument("--top-n", type=int, default=10)
+    p.add_argument("--chunk-size", type=int, default=50)
+    p.add_argument("--workers", type=int, default=None, help="Varsayılan: işlemci sayısı")
+    p.add_argument("--date-posted", choices=["all", "today", "3days", "week", "month"], default="all",
+                   help="Yalnızca bu pencerede yayınlanan ilanlar puanlanır")
+    p.add_argument("--restart", action="store_true", help="Kontrol noktasını yok say, baştan başla")
+    p.set_defaults(func=cmd_score)
+
+    p = commands.add_parser("cluster", help="Kullanıcıları kümele")
+    p.add_argument("--clusters", type=int, default=3)
+    p.add_argument("--output", default=None, help="Snapshot'ın yazılacağı JSON dosyası")
+    p.set_defaults(func=cmd_cluster)
+
+    p = commands.add_parser("export", help="Kullanıcı/ilan verisini dışa aktar")
+    p.add_argument("dataset", choices=["users", "jobs", "all"])
+    p.add_argument("--format", choices=["csv", "parquet", "excel"], default="csv")
+    p.add_argument("--gzip", action="store_true", help="CSV'yi gzip ile sıkıştır")
+    p.add_argument("--incremental", action="store_true", help="Yalnızca son export'tan beri değişenler")
+    p.add_argument("--full", action="store_true", help="Artımlı modda watermark'ı yok say")
+    p.add_argument("--folder", default="exports")
+    p.set_defaults(func=cmd_export)
+
+    p = commands.add_parser("bench", help="Performans ölçümleri")
+    p.add_argument("target", choices=["api", "startup"])
+    p.add_argument("--requests", type=int, default=50)
+    p.add_argument("--workers", type=int, default=8)
+    p.add_argument("--latency", type=float, default=0.05)
+    p.add_argument("--error-rate", type=float, default=0.1)
+    p.add_argument("--cache-ttl", type=float, default=0,
+                   help="İstemci yanıt önbelleği süresi (0: önbelleksiz, her istek sunucuya gider)")
+    p.add_argument("--budget-ms", type=float, default=None)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+import csv
+import json
+import os
+import shutil
+import time
+from multiprocessing import Pool
+from typing import Dict, List, Optional
+
+from ml.recommendation_cache import job_set_version, user_set_version
+from ml.recommender import JobRecommender
+from utils.catalog_snapshot import CatalogSnapshot, write_snapshot
+from utils.job_catalog import JobCatalog
+
+BREAKDOWN_KEYS = ["location", "skills", "salary", "job_type", "freshness"]
+
+OUTPUT_FIELDS = [
+    "user_id", "email", "rank", "job_id", "job_title", "company", "match_score",
+] + [f"{key}_score" for key in BREAKDOWN_KEYS]
+
+# İşçi süreç başına bir kez açılır (initializer)
+_worker_snapshot: Optional[CatalogSnapshot] = None
+_worker_recommender: Optional[JobRecommender] = None
+
+
+def load_jobs(catalog_file: str, jobs_file: str = "data/jobs.json",
+              date_posted: str = "all", now: float = None) -> List[Dict]:
+    """Puanlanacak aktif ilanlar; katalog boşsa yerel ilan dosyası kullanılır
+
+    date_posted (today, 3days, week, month) verilirse yalnızca pencereye
+    düşen gün bölümleri okunur; pasif ilanlar puanlamaya hiç girmez.
+    """
+
+    catalog = JobCatalog(catalog_file)
+    if not catalog.jobs and os.path.exists(jobs_file):
+        catalog.ingest_local_file(jobs_file)
+    return catalog.get_jobs(date_posted, now=now)
+
+
+def _init_worker(snapshot_dir: str):
+    """İşçi, ana sürecin yazdığı değişmez snapshot sürümünü açar (JSON yeniden okunmaz)
+
+    İlanlar işçiye kopyalanmaz; satırlar puanlama sırasında mmap'ten okunur,
+    sayfalar işçiler arasında işletim sistemi önbelleğinden paylaşılır.
+    """
+    global _worker_snapshot, _worker_recommender
+    _worker_snapshot = CatalogSnapshot(snapshot_dir)
+    _worker_recommender = JobRecommender()
+
+
+def _score_users(args) -> List[Dict]:
+    """Bir kullanıcı grubunu puanla, çıktı satırlarını döndür
+
+    Snapshot grup başına bir kez taranır: satır çözme maliyeti gruptaki
+    kullanıcılara bölünür, bellekte yalnızca kullanıcı başına top_n öneri kalır.
+    """
+
+    users, top_n = args
+    rows = []
+
+    per_user = _worker_recommender.recommend_jobs_many(
+        [user.get("profile", {}) for user in users], _worker_snapshot.iter_jobs(), top_n=top_n
+    )
+    for user, recommendations in zip(users, per_user):
+        for rank, rec in enumerate(recommendations, 1):
+            job = rec["job"]
+            row = {
+                "user_id": user.get("id"),
+                "email": user.get("email"),
+                "rank": rank,
+                "job_id": job.get("id"),
+                "job_title": job.get("title"),
+                "company": job.get("company"),
+                "match_score": rec["match_score"],
+            }
+            for key in BREAKDOWN_KEYS:
+                row[f"{key}_score"] = rec["score_breakdown"].get(key)
+            rows.append(row)
+
+    return rows
+
+
+class BatchRecommender:
+    """Tüm kullanıcılar için toplu öneri üretimi
+
+    Kullanıcılar e-postaya göre sıralanıp `chunk_size`'lık gruplara
+    bölünür ve işlemci çekirdeklerine dağıtılır. Ana süreç aktif ilanları
+    bir kez okur, içerik özetini (kontrol noktası anahtarı) hesaplar ve
+    aynı ilanları mmap snapshot sürümü olarak yazar; tüm işçiler bu
+    sürümü açar, katalog çalıştırma sırasında değişse de aynı ilan
+    kümesiyle puanlar. Sonuçlar tek bir CSV'ye sırayla eklenir. Her grup
+    yazıldıktan sonra kontrol noktası (işlenen kullanıcı sayısı ve dosya
+    boyutu) kaydedilir; yarıda kalan çalıştırma aynı ilan içeriği ve
+    aynı kullanıcı profilleriyle yeniden başlatılırsa kaldığı yerden devam
+    eder. Çalıştırma tamamlanınca kontrol noktası silinir.
+    """
+
+    def __init__(self, users_file: str = "data/users.json",
+                 catalog_file: str = "data/job_catalog.json",
+                 jobs_file: str = "data/jobs.json",
+                 output: str = "exports/recommendations_batch.csv",
+                 top_n: int = 10, chunk_size: int = 50, workers: int = None,
+                 date_posted: str = "all"):
+        self.users_file = users_file
+        self.catalog_file = catalog_file
+        self.jobs_file = jobs_file
+        self.output = output
+        self.checkpoint_file = f"{output}.checkpoint.json"
+        self.snapshot_dir = f"{output}.snapshot"
+        self.top_n = top_n
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.date_posted = date_posted
+
+    def load_users(self) -> List[Dict]:
+        """Kullanıcılar, sabit sırada (kontrol noktası bu sıraya göre tutulur)"""
+
+        if not os.path.exists(self.users_file):
+            return []
+        with open(self.users_file, 'r', encoding='utf-8') as f:
+            users = json.load(f)
+        return sorted(users.values(), key=lambda user: user.get("email", ""))
+
+    def _read_checkpoint(self) -> Dict:
+        if os.path.exists(self.checkpoint_file) and os.path.exists(self.output):
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _load_checkpoint(self, run_key: Dict) -> Dict:
+        """Aynı çalıştırmaya ait kontrol noktası (yoksa baştan)"""
+
+        checkpoint = self._read_checkpoint()
+        if checkpoint and all(checkpoint.get(key) == value for key, value in run_key.items()):
+            return checkpoint
+        return dict(run_key, users_done=0, bytes_written=0)
+
+    def _save_checkpoint(self, checkpoint: Dict):
+        tmp_file = f"{self.checkpoint_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def run(self, resume: bool = True) -> Dict:
+        """Toplu puanlamayı çalıştır, özet döndür"""
+
+        start = time.perf_counter()
+        users = self.load_users()
+
+        # Tarih penceresi yarıda kalan çalıştırmanın başlangıç anına göre kesilir;
+        # aksi halde pencere kayar ve kontrol noktası hiç eşleşmez. Bitmiş bir
+        # çalıştırmanın anı kullanılmaz: her yeni çalıştırma pencereyi şimdiden ölçer.
+        previous = self._read_checkpoint() if resume else {}
+        unfinished = (
+            previous.get("date_posted") == self.date_posted
+            and previous.get("top_n") == self.top_n
+            and previous.get("user_count") == len(users)
+            and previous.get("users_version") == user_set_version(users)
+            and previous.get("users_done", 0) < previous.get("user_count", 0)
+        )
+        as_of = previous["as_of"] if unfinished else time.time()
+        jobs = load_jobs(self.catalog_file, self.jobs_file, self.date_posted, now=as_of)
+
+        run_key = {
+            "jobs_version": job_set_version(jobs),
+            "users_version": user_set_version(users),
+            "user_count": len(users),
+            "top_n": self.top_n,
+            "date_posted": self.date_posted,
+            "as_of": as_of,
+        }
+        checkpoint = self._load_checkpoint(run_key) if resume else dict(run_key, users_done=0, bytes_written=0)
+        done = checkpoint["users_done"]
+        if not done:
+            checkpoint["bytes_written"] = 0
+
+        if done:
+            print(f"↩️ Kontrol noktasından devam: {done}/{len(users)} kullanıcı hazır")
+
+        os.makedirs(os.path.dirname(self.output) or ".", exist_ok=True)
+        mode = "r+" if done else "w"
+        with open(self.output, mode, encoding='utf-8', newline='') as f:
+            # Son kontrol noktasından sonra yarım yazılmış satırları at
+            f.seek(checkpoint["bytes_written"])
+            f.truncate()
+
+            writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+            if not done:
+                writer.writeheader()
+
+            snapshot_version = write_snapshot(jobs, self.snapshot_dir)
+            pending = users[done:]
+            chunks = [
+                (pending[i:i + self.chunk_size], self.top_n)
+                for i in range(0, len(pending), self.chunk_size)
+            ]
+
+            with Pool(self.workers, initializer=_init_worker,
+                      initargs=(snapshot_version,)) as pool:
+                # imap sırayı korur: kontrol noktası "ilk N kullanıcı" olarak tutulabilir
+                for (chunk_users, _), rows in zip(chunks, pool.imap(_score_users, chunks)):
+                    writer.writerows(rows)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                    done += len(chunk_users)
+                    checkpoint.update(users_done=done, bytes_written=f.tell())
+                    self._save_checkpoint(checkpoint)
+                    print(f"⏳ {done}/{len(users)} kullanıcı puanlandı")
+
+        # Tamamlanan çalıştırmanın kontrol noktası silinir; sonraki çalıştırma baştan puanlar
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+        shutil.rmtree(self.snapshot_dir, ignore_errors=True)
+
+        return {
+            "output": self.output,
+            "users": len(users),
+            "jobs": len(jobs),
+            "workers": self.workers,
+            "elapsed_s": round(time.perf_counter() - start, 2),
+        }
+
+
+# Test
+if __name__ == "__main__":
+    import sys
+
+    output = sys.argv[1] if len(sys.argv) > 1 else "/tmp/jobmatch_recommendations.csv"
+    summary = BatchRecommender(output=output, catalog_file="/tmp/jobmatch_batch_catalog.json", chunk_size=1).run()
+    print(json.dumps(summary, indent=2))
+
+    with open(output, 'r', encoding='utf-8') as f:
+        for line in f.readlines()[:4]:
+            print(line.rstrip())
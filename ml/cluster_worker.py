@@ -0,0 +1,168 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from utils.user_manager import UserManager
+
+
+def users_fingerprint(users: List[Dict]) -> str:
+    """Kullanıcı listesinin özeti (veri değişti mi kontrolü için)"""
+
+    digest = hashlib.sha256()
+    for user in sorted(users, key=lambda u: u.get("email", "")):
+        digest.update(user.get("email", "").encode("utf-8"))
+        digest.update(json.dumps(user.get("profile", {}), sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ClusteringWorker:
+    """Kullanıcı kümelemesini sayfa çiziminden ayıran arka plan işçisi
+
+    K-Means her turda yeni bir UserClusterer ile arka plan thread'inde
+    çalışır; sonuç (e-posta -> küme, küme istatistikleri, hesaplanma
+    zamanı) tek bir sözlük olarak `snapshot` alanına atanır. Atama tek
+    referans değişimi olduğu için okuyucular kilitsiz ve her zaman tutarlı
+    bir snapshot görür. Kullanıcı verisi değiştiğinde veya `refresh_after`
+    saniye geçtiğinde yeniden hesaplanır.
+    """
+
+    def __init__(self, load_users: Callable[[], List[Dict]], n_clusters: int = 3,
+                 refresh_after: float = 3600, cycle_seconds: float = 30):
+        self.load_users = load_users
+        self.n_clusters = n_clusters
+        self.refresh_after = refresh_after
+        self.cycle_seconds = cycle_seconds
+
+        self.snapshot: Optional[Dict] = None
+        self._fingerprint = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def trigger(self, *args):
+        """Bir sonraki turu beklemeden yeniden hesapla (UserManager dinleyicisi)"""
+        self._fingerprint = None
+        self._wake.set()
+
+    def is_due(self, users: List[Dict]) -> bool:
+        """Veri değiştiyse veya snapshot eskidiyse True"""
+
+        if self.snapshot is None or self._fingerprint != users_fingerprint(users):
+            return True
+        return time.time() - self.snapshot["computed_at"] >= self.refresh_after
+
+    def compute(self, users: List[Dict]) -> Dict:
+        """Kullanıcıları kümele ve yeni snapshot'ı döndür"""
+
+        # scikit-learn yalnızca işçi thread'inde yüklenir
+        from ml.user_clustering import UserClusterer
+
+        snapshot = {
+            "computed_at": time.time(),
+            "user_count": len(users),
+            "labels": {},
+            "stats": {},
+        }
+        if len(users) < self.n_clusters:
+            return snapshot
+
+        clusterer = UserClusterer(n_clusters=self.n_clusters)
+        snapshot["stats"] = clusterer.get_cluster_stats(users)
+        snapshot["labels"] = {
+            user["email"]: int(label)
+            for user, label in zip(users, clusterer.kmeans.labels_)
+        }
+        return snapshot
+
+    def run_once(self, force: bool = False) -> bool:
+        """Gerekliyse yeniden hesapla; yeni snapshot yayınlandıysa True"""
+
+        # Tur içindeki her hata yakalanır; aksi halde daemon thread sessizce ölür
+        try:
+            users = self.load_users()
+            if not force and not self.is_due(users):
+                return False
+
+            fingerprint = users_fingerprint(users)
+            self.snapshot = self.compute(users)
+        except Exception as e:
+            print(f"Kümeleme hatası: {e}")
+            return False
+
+        self._fingerprint = fingerprint
+        return True
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:  # run_once dışında kalan beklenmedik hatalar
+                print(f"Kümeleme işçisi hatası: {e}")
+            self._wake.wait(self.cycle_seconds)
+            self._wake.clear()
+
+    def start(self):
+        """Profil dinleyicisini ve arka plan thread'ini başlat"""
+
+        if self.trigger not in UserManager.profile_listeners:
+            UserManager.profile_listeners.append(self.trigger)
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, daemon=True, name="user-clustering")
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """İşçiyi durdur"""
+
+        self._stop.set()
+        self._wake.set()
+        if self.trigger in UserManager.profile_listeners:
+            UserManager.profile_listeners.remove(self.trigger)
+
+    def cluster_of(self, email: str) -> Optional[int]:
+        """Kullanıcının son snapshot'taki kümesi (henüz hesaplanmadıysa None)"""
+
+        snapshot = self.snapshot
+        return None if snapshot is None else snapshot["labels"].get(email)
+
+    def similar_users(self, email: str, top_n: int = 5) -> List[str]:
+        """Aynı kümedeki diğer kullanıcıların e-postaları"""
+
+        snapshot = self.snapshot
+        cluster = None if snapshot is None else snapshot["labels"].get(email)
+        if cluster is None:
+            return []
+
+        return [
+            other for other, label in snapshot["labels"].items()
+            if label == cluster and other != email
+        ][:top_n]
+
+
+# Test
+if __name__ == "__main__":
+    manager = UserManager()
+    worker = ClusteringWorker(manager.snapshot_users, cycle_seconds=1).start()
+
+    start = time.perf_counter()
+    while worker.snapshot is None:
+        time.sleep(0.05)
+    print(f"📊 İlk snapshot {(time.perf_counter() - start) * 1000:.0f} ms sonra hazır, "
+          f"{worker.snapshot['user_count']} kullanıcı")
+    print(json.dumps(worker.snapshot["stats"], ensure_ascii=False, indent=2))
+
+    computed_at = worker.snapshot["computed_at"]
+    time.sleep(2)
+    print(f"🔁 Veri değişmedi, yeniden hesaplandı mı: {worker.snapshot['computed_at'] != computed_at}")
+
+    # Yükleme hatası thread'i öldürmemeli
+    worker.load_users = lambda: 1 / 0
+    worker.trigger()
+    time.sleep(0.5)
+    print(f"🛡️ Hatadan sonra işçi çalışıyor mu: {worker._thread.is_alive()}")
+    worker.stop()
@@ -0,0 +1,128 @@
+import zlib
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from utils.text import tokenize
+
+_PRIME = (1 << 31) - 1  # Mersenne asal; çarpımlar int64'e sığar
+
+
+class NearDuplicateDetector:
+    """MinHash + LSH ile neredeyse aynı iş ilanlarını bulur
+
+    Her ilan başlık + şirket + açıklama kelime shingle'larına bölünür,
+    `num_perm` hash ile MinHash imzası çıkarılır. İmza `bands` parçaya
+    ayrılıp kovalanır; aynı kovaya düşen adaylar aynı işverene aitse ve
+    imza benzerliği `threshold` üstündeyse aynı gruba konur. Kısa şablon
+    ilanlarda metin neredeyse aynı olabildiği için farklı işverenlerin
+    ilanları hiçbir zaman birleştirilmez.
+    """
+
+    def __init__(self, num_perm=64, bands=16, shingle_size=3, threshold=0.8, seed=42):
+        assert num_perm % bands == 0, "num_perm bands'a tam bölünmeli"
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, _PRIME, size=num_perm, dtype=np.int64)
+        self.b = rng.randint(0, _PRIME, size=num_perm, dtype=np.int64)
+
+    @staticmethod
+    def job_text(job: Dict) -> str:
+        """İlanın karşılaştırılacak metni"""
+        return f"{job.get('title', '')} {job.get('company', '')} {job.get('description', '')}"
+
+    @staticmethod
+    def employer_key(job: Dict) -> str:
+        """Normalize edilmiş işveren adı (harf katlamalı, noktalama ve boşluk farkı yok)"""
+        return " ".join(tokenize(job.get("company") or ""))
+
+    def shingles(self, text: str) -> set:
+        """Kelime k-shingle kümesi"""
+
+        tokens = tokenize(text)
+        k = self.shingle_size
+        if len(tokens) < k:
+            return {" ".join(tokens)} if tokens else set()
+        return {" ".join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+
+    def signature(self, shingles: set) -> np.ndarray:
+        """MinHash imzası (num_perm uzunluğunda)"""
+
+        if not shingles:
+            return np.full(self.num_perm, _PRIME, dtype=np.int64)
+
+        hashes = np.array(
+            [zlib.crc32(s.encode("utf-8")) % _PRIME for s in shingles],
+            dtype=np.int64
+        )
+        return ((np.outer(self.a, hashes) + self.b[:, None]) % _PRIME).min(axis=1)
+
+    def find_groups(self, jobs: List[Dict]) -> List[List[str]]:
+        """Tekrarlanan ilan gruplarını (en az 2 ilan) id listesi olarak döndür"""
+
+        ids = [job["id"] for job in jobs]
+        employers = [self.employer_key(job) for job in jobs]
+        signatures = np.array([self.signature(self.shingles(self.job_text(job))) for job in jobs])
+
+        # LSH: her bant için kova
+        candidates = set()
+        for band in range(self.bands):
+            buckets = defaultdict(list)
+            start = band * self.rows
+            for i, sig in enumerate(signatures):
+                buckets[sig[start:start + self.rows].tobytes()].append(i)
+            for members in buckets.values():
+                for x in range(len(members)):
+                    for y in range(x + 1, len(members)):
+                        candidates.add((members[x], members[y]))
+
+        # Union-find ile grupla
+        parent = list(range(len(jobs)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in candidates:
+            if employers[i] != employers[j]:
+                continue
+            similarity = float(np.mean(signatures[i] == signatures[j]))
+            if similarity >= self.threshold:
+                parent[find(i)] = find(j)
+
+        groups = defaultdict(list)
+        for i in range(len(jobs)):
+            groups[find(i)].append(ids[i])
+
+        return [group for group in groups.values() if len(group) > 1]
+
+
+def job_completeness(job: Dict) -> int:
+    """Dolu alan sayısı (grubun temsilcisini seçmek için)"""
+    return sum(1 for value in job.values() if value not in (None, "", [], {}))
+
+
+def collapse_duplicates(jobs: List[Dict], detector: NearDuplicateDetector = None) -> List[Dict]:
+    """Neredeyse aynı ilanlardan yalnızca en dolu olanı bırak (sıra korunur)"""
+
+    if len(jobs) < 2:
+        return list(jobs)
+
+    detector = detector or NearDuplicateDetector()
+    by_id = {job["id"]: job for job in jobs}
+
+    dropped = set()
+    for group in detector.find_groups(list(by_id.values())):
+        keep = max(group, key=lambda job_id: job_completeness(by_id[job_id]))
+        dropped.update(job_id for job_id in group if job_id != keep)
+
+    return [job for job in jobs if job["id"] not in dropped]
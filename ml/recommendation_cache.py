@@ -0,0 +1,140 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List
+
+from utils.job_catalog import content_of
+
+# Skoru etkileyen profil alanları (ml/recommender.py içinde okunanlar)
+SCORING_PROFILE_FIELDS = (
+    "skills",
+    "location",
+    "min_hourly_wage",
+    "max_distance_km",
+    "preferred_job_types",
+    "remote_preference",
+)
+
+
+def profile_key(profile: Dict) -> str:
+    """Profilin skorlamayı etkileyen alanlarının özeti"""
+
+    relevant = {field: profile.get(field) for field in SCORING_PROFILE_FIELDS}
+    encoded = json.dumps(relevant, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def job_set_version(jobs: Iterable[Dict]) -> str:
+    """İlan kümesinin sürüm kimliği (aynı ilanlar ve aynı içerik aynı sürümü verir)
+
+    Yalnızca id'ler değil ilan içeriği de özetlenir; düzenlenen bir ilan
+    sürümü değiştirir. Katalogun kendi tuttuğu zaman alanları hariçtir.
+    """
+
+    digest = hashlib.sha256()
+    for job in jobs:
+        digest.update(str(job.get("id")).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(json.dumps(content_of(job), sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def user_set_version(users: Iterable[Dict]) -> str:
+    """Kullanıcı kümesinin sürüm kimliği (id, e-posta ve skorlamayı etkileyen profil alanları)"""
+
+    digest = hashlib.sha256()
+    for user in users:
+        digest.update(f"{user.get('id')}\0{user.get('email')}\0".encode("utf-8"))
+        digest.update(profile_key(user.get("profile") or {}).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+
+class RecommendationCache:
+    """Öneri sonuçları için LRU önbellek
+
+    Anahtar (kullanıcı, profil özeti, ilan kümesi sürümü, top_n) olduğu
+    için profil veya ilan kümesi değişmedikçe Streamlit rerun'ları
+    skorlamayı tekrar çalıştırmaz. Profil güncellemesi ve yeni arama
+    kullanıcının kayıtlarını açıkça siler.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, user_id: str, profile: Dict, version: str, top_n: int,
+                       compute: Callable[[], List[Dict]]) -> List[Dict]:
+        """Önbellekte varsa döndür, yoksa compute() ile hesaplayıp kaydet"""
+
+        key = (user_id, profile_key(profile), version, top_n)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Skorlama kilit dışında; aynı anda iki hesap olursa sonuncusu yazılır
+        recommendations = compute()
+
+        with self._lock:
+            self._entries[key] = recommendations
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return recommendations
+
+    def invalidate_user(self, user_id: str, *args):
+        """Kullanıcının tüm kayıtlarını sil (UserManager dinleyicisi olarak da kullanılır)"""
+
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def invalidate_version(self, version: str):
+        """Bir ilan kümesi sürümüne ait kayıtları sil"""
+
+        with self._lock:
+            for key in [key for key in self._entries if key[2] == version]:
+                del self._entries[key]
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Test
+if __name__ == "__main__":
+    import time
+
+    from ml.recommender import JobRecommender
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog("/tmp/jobmatch_catalog_test.json")
+    catalog.ingest_local_file("data/jobs.json")
+    jobs = catalog.get_active_jobs()
+
+    recommender = JobRecommender()
+    cache = RecommendationCache()
+    profile = {"skills": ["Python", "İngilizce"], "min_hourly_wage": 75, "preferred_job_types": ["Part-time"]}
+    version = job_set_version(jobs)
+
+    for attempt in range(3):
+        start = time.perf_counter()
+        recs = cache.get_or_compute("test@university.edu", profile, version, 10,
+                                    lambda: recommender.recommend_jobs(profile, jobs, top_n=10))
+        print(f"#{attempt + 1}: {len(recs)} öneri ({(time.perf_counter() - start) * 1000:.2f} ms)")
+
+    cache.invalidate_user("test@university.edu")
+    print(f"✅ hit={cache.hits} miss={cache.misses}, geçersiz kılındıktan sonra {len(cache)} kayıt")
@@ -1,7 +1,37 @@
+import heapq
 import math
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Tuple
 import re
 
+# Ham API alanı -> _format_job çıktısındaki karşılığı (iç içe yol)
+FORMATTED_JOB_KEYS = {
+    'job_title': ('title',),
+    'job_description': ('description',),
+    'job_is_remote': ('is_remote',),
+    'job_latitude': ('latitude',),
+    'job_longitude': ('longitude',),
+    'job_required_skills': ('required_skills',),
+    'job_employment_type': ('employment_type',),
+    'job_min_salary': ('salary', 'min'),
+    'job_max_salary': ('salary', 'max'),
+    'job_salary_period': ('salary', 'period'),
+    'job_posted_at_timestamp': ('posted_timestamp',),
+}
+
+
+def job_field(job: Dict, key: str, default=None):
+    """İlan alanını oku: önce ham API adı, yoksa düzenlenmiş karşılığı"""
+    
+    value = job.get(key)
+    
+    if value is None and key in FORMATTED_JOB_KEYS:
+        value = job
+        for part in FORMATTED_JOB_KEYS[key]:
+            value = value.get(part) if isinstance(value, dict) else None
+    
+    return default if value is None else value
+
+
 class JobRecommender:
     """AI tabanlı iş önerme sistemi"""
     
@@ -40,7 +70,7 @@ class JobRecommender:
         """Konum uyumu skoru (0-1)"""
         
         # Remote işler için maksimum skor
-        if job.get('job_is_remote', False):
+        if job_field(job, 'job_is_remote', False):
             if user_profile.get('remote_preference') in ['Remote', 'No Preference']:
                 return 1.0
             else:
@@ -52,8 +82,8 @@ class JobRecommender:
             return 0.5  # Varsayılan orta skor
         
         # İş konumu parse et (job_latitude ve job_longitude API'den geliyor)
-        job_lat = job.get('job_latitude')
-        job_lon = job.get('job_longitude')
+        job_lat = job_field(job, 'job_latitude')
+        job_lon = job_field(job, 'job_longitude')
         
         if not job_lat or not job_lon:
             return 0.5
@@ -82,11 +112,11 @@ class JobRecommender:
             return 0.5  # Beceri bilgisi yoksa orta skor
         
         # İş açıklamasından beceri çıkar
-        job_desc = job.get('job_description', '').lower()
-        job_title = job.get('job_title', '').lower()
+        job_desc = job_field(job, 'job_description', '').lower()
+        job_title = job_field(job, 'job_title', '').lower()
         
         # API'den gelen required_skills varsa kullan
-        job_skills = job.get('job_required_skills', [])
+        job_skills = job_field(job, 'job_required_skills', [])
         if job_skills:
             job_skills = set([s.lower() for s in job_skills])
         else:
@@ -118,15 +148,15 @@ class JobRecommender:
         if not min_wage:
             return 0.7  # Ücret tercihi belirtmemişse nötr skor
         
-        job_min = job.get('job_min_salary')
-        job_max = job.get('job_max_salary')
+        job_min = job_field(job, 'job_min_salary')
+        job_max = job_field(job, 'job_max_salary')
         
         # Maaş bilgisi yoksa orta skor
         if not job_min and not job_max:
             return 0.6
         
         # Aylık/yıllık maaşı saatlik ücrete çevir (yaklaşık)
-        salary_period = job.get('job_salary_period', '').upper()
+        salary_period = job_field(job, 'job_salary_period', '').upper()
         
         if salary_period == 'YEAR' and job_min:
             job_min = job_min / (52 * 40)  # Yıllık -> saatlik
@@ -149,7 +179,7 @@ class JobRecommender:
         if not preferred_types:
             return 0.7  # Tercih belirtmemişse nötr
         
-        job_type = job.get('job_employment_type', '').upper()
+        job_type = job_field(job, 'job_employment_type', '').upper()
         
         # Tercih edilen tipleri kontrol et
         type_mapping = {
@@ -170,7 +200,7 @@ class JobRecommender:
     def score_freshness(self, job: Dict) -> float:
         """İlanın ne kadar yeni olduğu skoru (0-1)"""
         
-        posted_at = job.get('job_posted_at_timestamp')
+        posted_at = job_field(job, 'job_posted_at_timestamp')
         
         if not posted_at:
             return 0.5
@@ -210,26 +240,63 @@ class JobRecommender:
         
         return final_score, scores
     
-    def recommend_jobs(self, user_profile: Dict, jobs: List[Dict], 
+    def _recommendation(self, user_profile: Dict, job: Dict) -> Dict:
+        """Tek ilan için öneri kaydı (skor ve alt skorlar)"""
+        
+        score, score_details = self.calculate_match_score(user_profile, job)
+        
+        return {
+            'job': job,
+            'match_score': round(score, 2),
+            'score_breakdown': {k: round(v * 100, 1) for k, v in score_details.items()}
+        }
+    
+    def recommend_jobs(self, user_profile: Dict, jobs: Iterable[Dict], 
                       top_n: int = 10) -> List[Dict]:
-        """Kullanıcıya en uygun işleri öner"""
+        """Kullanıcıya en uygun işleri öner (liste veya akış kabul eder)"""
         
         recommendations = []
         
         for job in jobs:
-            score, score_details = self.calculate_match_score(user_profile, job)
+            # Yayından kalkmış/pasif ilanlar puanlanmaz
+            if job.get('is_active') is False:
+                continue
             
-            recommendations.append({
-                'job': job,
-                'match_score': round(score, 2),
-                'score_breakdown': {k: round(v * 100, 1) for k, v in score_details.items()}
-            })
+            recommendations.append(self._recommendation(user_profile, job))
         
         # Skora göre sırala (yüksekten düşüğe)
         recommendations.sort(key=lambda x: x['match_score'], reverse=True)
         
         return recommendations[:top_n]
-
+    
+    def recommend_jobs_many(self, user_profiles: List[Dict], jobs: Iterable[Dict],
+                            top_n: int = 10) -> List[List[Dict]]:
+        """Birden fazla profil için öneri; ilan akışı tek geçişte okunur
+        
+        Her ilan okunduğunda tüm profillere puanlanır ve her profil için
+        yalnızca en iyi top_n kayıt tutulur; ilan listesi bellekte
+        biriktirilmez. Sonuç her profil için recommend_jobs ile aynıdır
+        (eşit skorda önce gelen ilan önde).
+        """
+        
+        heaps = [[] for _ in user_profiles]
+        if top_n <= 0:
+            return heaps
+        
+        for i, job in enumerate(jobs):
+            if job.get('is_active') is False:
+                continue
+            
+            for user_profile, heap in zip(user_profiles, heaps):
+                rec = self._recommendation(user_profile, job)
+                # (skor, -sıra): en küçük eleman elenecek olandır
+                entry = (rec['match_score'], -i, rec)
+                if len(heap) < top_n:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+        
+        return [[rec for _, _, rec in sorted(heap, key=lambda e: e[:2], reverse=True)] for heap in heaps]
 
 # Test
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+import requests
+
+from utils.api_client import JSearchClient
+from utils.jsearch_stub import JSearchStubServer
+from utils.rate_limit import TokenBucket
+from utils.response_cache import TTLCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def stub():
+    """Saniyede 2 isteğe izin veren sahte sunucu (fazlası 429)"""
+    with JSearchStubServer(jobs_file=os.path.join(ROOT, "data", "jobs.json"),
+                           latency=0.2, jitter=0, rate_limit=2) as server:
+        yield server
+
+
+def make_client(stub):
+    return JSearchClient(base_url=stub.url, limiter=TokenBucket(rate=1000, capacity=1000),
+                         cache=TTLCache(ttl=0))
+
+
+def test_search_many_keeps_finished_pairs_when_some_are_throttled(stub):
+    pairs = [("garson", "Istanbul"), ("kurye", "Ankara"), ("çeviri", "Izmir"), ("kasiyer", "Bursa")]
+    throttled = []
+
+    jobs, provenance = make_client(stub).search_many(pairs, date_posted="all", throttled=throttled)
+
+    assert stub.stats["throttled"] == len(throttled) == 2
+    assert all((t["query"], t["location"]) in pairs and t["retry_after"] > 0 for t in throttled)
+    assert jobs
+
+
+def test_search_jobs_stream_skips_throttled_pages(stub):
+    throttled = []
+
+    jobs = list(make_client(stub).search_jobs_stream(query="", location="Turkey", num_pages=4,
+                                                     date_posted="all", throttled=throttled))
+
+    assert stub.stats["throttled"] == len(throttled) == 2
+    assert set(throttled) <= {1, 2, 3, 4}
+    assert jobs
+
+
+def test_slow_server_times_out_instead_of_hanging():
+    with JSearchStubServer(jobs_file=os.path.join(ROOT, "data", "jobs.json"), latency=2, jitter=0) as slow:
+        client = JSearchClient(base_url=slow.url, limiter=TokenBucket(rate=1000, capacity=1000),
+                               cache=TTLCache(ttl=0), timeout=0.2)
+
+        with pytest.raises(requests.exceptions.Timeout):
+            client.fetch_jobs(query="garson", location="Istanbul", date_posted="all")
+
+        assert client.search_jobs(query="garson", location="Istanbul", date_posted="all") == []
+
+
+def test_timeout_is_configurable_from_environment(monkeypatch):
+    monkeypatch.setenv("JSEARCH_TIMEOUT", "3.5")
+    assert JSearchClient().timeout == 3.5
+
+
+def test_search_many_gives_id_less_jobs_the_key_used_for_provenance():
+    class IdLessClient(JSearchClient):
+        def search_jobs(self, query="", location="", num_pages=1, date_posted="today"):
+            return [{"id": "", "title": "Garson", "company": "Kafe"}, {"id": "J1", "title": "Kurye", "company": "X"}]
+
+    jobs, provenance = IdLessClient().search_many([("garson", "Istanbul"), ("garson", "Ankara")])
+
+    assert [job["id"] for job in jobs] == ["Garson|Kafe", "J1"]
+    assert all(len(provenance[job["id"]]) == 2 for job in jobs)
@@ -0,0 +1,109 @@
+import csv
+import json
+import os
+
+from ml.batch_recommend import BatchRecommender
+from ml.recommendation_cache import user_set_version
+from utils.user_manager import profile_from_student
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_users(path, students):
+    users = {
+        s["email"]: {"id": s["id"], "email": s["email"], "name": s["name"], "profile": profile_from_student(s)}
+        for s in students
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(users, f, ensure_ascii=False)
+
+
+def make_batch(tmp_path, **kwargs):
+    return BatchRecommender(
+        users_file=str(tmp_path / "users.json"),
+        catalog_file=str(tmp_path / "catalog.json"),
+        jobs_file=os.path.join(ROOT, "data", "jobs.json"),
+        output=str(tmp_path / "recs.csv"),
+        top_n=3, chunk_size=1, workers=1, **kwargs
+    )
+
+
+def read_rows(batch):
+    with open(batch.output, encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def load_students(n=2):
+    with open(os.path.join(ROOT, "data", "students.json"), encoding="utf-8") as f:
+        return json.load(f)[:n]
+
+
+def test_finished_run_leaves_no_checkpoint_and_rescoring_sees_profile_edits(tmp_path):
+    students = load_students()
+    write_users(tmp_path / "users.json", students)
+    batch = make_batch(tmp_path)
+
+    batch.run()
+    first = read_rows(batch)
+    assert not os.path.exists(batch.checkpoint_file)
+
+    # Aynı ilanlar, aynı kullanıcı sayısı, farklı profiller
+    for student in students:
+        student["skills"] = ["Python"]
+        student["preferences"]["min_hourly_wage"] = 1000
+    write_users(tmp_path / "users.json", students)
+    batch.run()
+
+    assert read_rows(batch) != first
+
+
+def test_interrupted_run_resumes_with_same_result(tmp_path):
+    write_users(tmp_path / "users.json", load_students(3))
+    batch = make_batch(tmp_path)
+
+    # Her grup sonrası kaydedilen kontrol noktalarını yakala
+    saved = []
+    batch._save_checkpoint = lambda checkpoint: saved.append(dict(checkpoint))
+    batch.run()
+    del batch._save_checkpoint
+    with open(batch.output, encoding="utf-8") as f:
+        full = f.read()
+
+    # İlk kullanıcıdan sonra, ikinci grup yarım yazılmışken çökmüş gibi
+    after_first = saved[0]
+    batch._save_checkpoint(after_first)
+    with open(batch.output, "r+", encoding="utf-8", newline="") as f:
+        f.seek(after_first["bytes_written"])
+        f.truncate()
+        f.write("yarım,satır")
+
+    batch.run()
+
+    with open(batch.output, encoding="utf-8") as f:
+        assert f.read() == full
+    assert not os.path.exists(batch.checkpoint_file)
+
+
+def test_window_is_measured_from_now_unless_resuming(tmp_path, monkeypatch):
+    write_users(tmp_path / "users.json", load_students(2))
+    batch = make_batch(tmp_path, date_posted="today")
+    seen = []
+    monkeypatch.setattr("ml.batch_recommend.load_jobs",
+                        lambda *args, now=None: seen.append(now) or [])
+
+    # Bitmiş bir çalıştırmadan kalmış kontrol noktası: anı yeniden kullanılmaz
+    batch.run()
+    stale = {"date_posted": "today", "top_n": 3, "user_count": 2, "users_done": 2,
+             "users_version": user_set_version(batch.load_users()), "as_of": 1.0, "bytes_written": 0}
+    batch._save_checkpoint(stale)
+    batch.run()
+    assert seen[-1] > 1.0
+
+    # Yarıda kalmış aynı çalıştırma: başlangıç anı korunur
+    saved = []
+    batch._save_checkpoint = lambda checkpoint: saved.append(dict(checkpoint))
+    batch.run()
+    del batch._save_checkpoint
+    batch._save_checkpoint(dict(saved[0], as_of=1.0))
+    batch.run()
+    assert seen[-1] == 1.0
@@ -0,0 +1,113 @@
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Geçici veri klasörü; örnek ilanlar repodaki data/jobs.json'dan gelir"""
+    monkeypatch.setattr(cli, "JOBS_FILE", os.path.join(ROOT, "data", "jobs.json"))
+    return tmp_path
+
+
+def run(data_dir, *args):
+    return cli.main([
+        "--users", str(data_dir / "users.json"),
+        "--catalog", str(data_dir / "catalog.json"),
+        *args,
+    ])
+
+
+def import_students(data_dir):
+    return run(data_dir, "import-students", "--file", os.path.join(ROOT, "data", "students.json"))
+
+
+def test_parser_requires_a_subcommand():
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args([])
+
+    args = cli.build_parser().parse_args(["export", "jobs", "--format", "parquet", "--incremental"])
+    assert (args.dataset, args.format, args.incremental) == ("jobs", "parquet", True)
+
+
+def test_cli_does_not_import_streamlit_or_heavy_modules():
+    code = "import sys, cli; cli.build_parser(); print([m for m in ('streamlit', 'pandas', 'sklearn') if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_students_is_idempotent(data_dir, capsys):
+    assert import_students(data_dir) == 0
+    assert json.loads(capsys.readouterr().out)["created"] == 50
+
+    assert import_students(data_dir) == 0
+    assert json.loads(capsys.readouterr().out) == {"students": 50, "created": 0, "skipped": 50}
+
+    with open(data_dir / "users.json", encoding="utf-8") as f:
+        users = json.load(f)
+    profile = users["student1@university.edu"]["profile"]
+    assert profile["city"] == "Ankara" and profile["min_hourly_wage"] == 60
+
+
+def test_score_writes_ranked_rows_for_every_user(data_dir, capsys):
+    import_students(data_dir)
+    output = data_dir / "recs.csv"
+
+    assert run(data_dir, "score", "--output", str(output), "--top-n", "3", "--workers", "1",
+               "--chunk-size", "20") == 0
+
+    with open(output, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len({row["email"] for row in rows}) == 50
+    assert {row["rank"] for row in rows} == {"1", "2", "3"}
+    assert not os.path.exists(f"{output}.snapshot")
+
+
+def test_export_csv_and_incremental(data_dir, capsys):
+    import_students(data_dir)
+    capsys.readouterr()
+    folder = data_dir / "exports"
+
+    assert run(data_dir, "export", "all", "--gzip", "--folder", str(folder)) == 0
+    paths = json.loads(capsys.readouterr().out)
+    assert all(os.path.exists(path) and path.endswith(".csv.gz") for path in paths.values())
+
+    assert run(data_dir, "export", "jobs", "--incremental", "--folder", str(folder)) == 0
+    assert json.loads(capsys.readouterr().out)["jobs"]["rows"] > 0
+
+    # Katalog kaydedildiği için ikinci çalıştırmada değişen ilan yok
+    assert run(data_dir, "export", "jobs", "--incremental", "--folder", str(folder)) == 0
+    assert json.loads(capsys.readouterr().out)["jobs"] is None
+
+
+def test_incremental_export_sends_jobs_marked_by_dedupe(data_dir, capsys):
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog(str(data_dir / "catalog.json"))
+    template = {"title": "Kurye - Kadıköy", "company": "Firma X", "description": "Kurye aranıyor. Kadıköy, İstanbul."}
+    catalog.upsert_jobs([dict(template, id="A"), dict(template, id="B")], seen_at=100)
+    catalog.save()
+    folder = data_dir / "exports"
+
+    assert run(data_dir, "export", "jobs", "--incremental", "--folder", str(folder)) == 0
+    assert json.loads(capsys.readouterr().out)["jobs"]["rows"] == 2
+
+    # dedupe iki export arasında bir ilanı tekrar olarak işaretler
+    catalog = JobCatalog(str(data_dir / "catalog.json"))
+    assert catalog.dedupe() == 1
+    catalog.save()
+
+    assert run(data_dir, "export", "jobs", "--incremental", "--folder", str(folder)) == 0
+    entry = json.loads(capsys.readouterr().out)["jobs"]
+    assert entry is not None and entry["rows"] == 1
+    with open(entry["path"], encoding="utf-8-sig") as f:
+        row = next(csv.DictReader(f))
+    assert row["Duplicate Of"] in ("A", "B") and row["Job ID"] != row["Duplicate Of"]
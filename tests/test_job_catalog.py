@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+
+from utils.job_catalog import JobCatalog
+
+
+class RecordingPartitions(dict):
+    """Okunan gün bölümlerini kaydeden sözlük"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.read = []
+
+    def __getitem__(self, day):
+        self.read.append(day)
+        return super().__getitem__(day)
+
+
+def make_catalog(tmp_path, days=10):
+    catalog = JobCatalog(str(tmp_path / "catalog.json"))
+    catalog.upsert_jobs([
+        {"id": f"J{day:02d}", "title": f"İlan {day}", "posted_date": f"2026-01-{day:02d}T10:00:00"}
+        for day in range(1, days + 1)
+    ])
+    return catalog
+
+
+def test_windowed_query_reads_only_recent_partitions(tmp_path):
+    catalog = make_catalog(tmp_path)
+    catalog._partitions = RecordingPartitions(catalog._partitions)
+    now = datetime(2026, 1, 10, 12, tzinfo=timezone.utc).timestamp()
+
+    jobs = catalog.get_jobs("3days", now=now)
+
+    # Zaman damgası olmayan ilanlar gün hassasiyetinde kesilir: sınır günü dahil
+    assert [job["id"] for job in jobs] == ["J10", "J09", "J08", "J07"]
+    assert sorted(set(catalog._partitions.read)) == ["2026-01-07", "2026-01-08", "2026-01-09", "2026-01-10"]
+
+
+def test_inactive_and_duplicate_jobs_never_returned(tmp_path):
+    catalog = make_catalog(tmp_path)
+    catalog.expire_jobs(["J10"])
+    catalog.jobs["J09"]["duplicate_of"] = "J08"
+
+    ids = {job["id"] for job in catalog.get_jobs("all")}
+
+    assert "J10" not in ids and "J09" not in ids
+    assert len(ids) == 8
+
+
+def test_dedupe_marks_changed_duplicates_as_updated(tmp_path):
+    catalog = JobCatalog(str(tmp_path / "catalog.json"))
+    template = {"title": "Kurye - Kadıköy", "company": "Firma X", "description": "Kurye aranıyor. Kadıköy, İstanbul."}
+    catalog.upsert_jobs([dict(template, id="A"), dict(template, id="B")], seen_at=100)
+
+    assert catalog.dedupe(changed_at=200) == 1
+    marked = [job for job in catalog.jobs.values() if job.get("duplicate_of")]
+    assert len(marked) == 1 and marked[0]["updated_at"] == 200
+
+    # Değişiklik yoksa zaman damgası ilerlemez
+    catalog.dedupe(changed_at=300)
+    assert marked[0]["updated_at"] == 200
+
+    # İşaret kalkınca da değişiklik sayılır
+    catalog.jobs["A"]["company"] = "Firma A"
+    catalog.dedupe(changed_at=400)
+    assert not marked[0].get("duplicate_of") and marked[0]["updated_at"] == 400
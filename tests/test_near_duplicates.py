@@ -0,0 +1,25 @@
+from ml.near_duplicates import NearDuplicateDetector, collapse_duplicates
+
+
+def posting(job_id, company, district="Alsancak"):
+    return {
+        "id": job_id,
+        "title": f"Veri Girişi - {district}",
+        "company": company,
+        "description": f"Veri Girişi pozisyonu için eleman aranıyor. {district}, İzmir bölgesinde.",
+    }
+
+
+def test_same_text_from_different_employers_is_not_merged():
+    jobs = [posting("J063", "Firma X"), posting("J088", "Firma A")]
+
+    assert NearDuplicateDetector().find_groups(jobs) == []
+    assert len(collapse_duplicates(jobs)) == 2
+
+
+def test_same_posting_from_same_employer_is_merged():
+    jobs = [posting("J1", "Firma X"), posting("J2", "FİRMA  X."), posting("J3", "Firma A")]
+
+    groups = NearDuplicateDetector().find_groups(jobs)
+
+    assert [sorted(group) for group in groups] == [["J1", "J2"]]
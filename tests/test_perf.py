@@ -0,0 +1,16 @@
+from utils.perf import app_imports, measure_imports
+
+
+def test_app_imports_follow_app_py():
+    modules = app_imports()
+
+    # Sonradan app.py'ye eklenen modüller de ölçülür
+    for module in ("ml.recommendation_cache", "utils.result_cache", "utils.search_tasks"):
+        assert module in modules
+    # Fonksiyon içindeki tembel import'lar giriş sayfası bütçesine girmez
+    for module in ("utils.data_export", "ml.cluster_worker", "ml.near_duplicates"):
+        assert module not in modules
+
+
+def test_app_imports_load_no_heavy_modules():
+    assert measure_imports()["heavy_loaded"] == []
@@ -0,0 +1,31 @@
+import time
+
+from utils.prefetch import PrefetchScheduler
+
+
+class BrokenClient:
+    """Yenilemede beklenmedik hata veren istemci"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def cache_age(self, params):
+        return None
+
+    def refresh(self, params):
+        self.calls += 1
+        raise ValueError("bozuk yanıt")
+
+
+def test_loop_survives_unexpected_errors():
+    client = BrokenClient()
+    scheduler = PrefetchScheduler(client, calls_per_hour=3600 * 100, cycle_seconds=0.01)
+    scheduler.record("garson", "Istanbul", "today", [{"query": "garson in Istanbul"}])
+
+    scheduler.start()
+    try:
+        time.sleep(0.2)
+        assert scheduler._thread.is_alive()
+        assert client.calls > 1
+    finally:
+        scheduler.stop()
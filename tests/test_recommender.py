@@ -0,0 +1,25 @@
+import json
+import os
+
+from ml.recommender import JobRecommender
+from utils.job_catalog import JobCatalog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_recommend_jobs_many_matches_recommend_jobs_from_a_stream(tmp_path):
+    catalog = JobCatalog(str(tmp_path / "catalog.json"))
+    catalog.ingest_local_file(os.path.join(ROOT, "data", "jobs.json"))
+    jobs = catalog.get_active_jobs() * 3  # Eşit skorlu kopyalar: sıra da korunmalı
+
+    with open(os.path.join(ROOT, "data", "students.json"), "r", encoding="utf-8") as f:
+        profiles = [{"skills": student.get("skills", [])} for student in json.load(f)[:5]]
+    profiles.append({})
+
+    recommender = JobRecommender()
+    many = recommender.recommend_jobs_many(profiles, iter(jobs), top_n=7)
+
+    for profile, recommendations in zip(profiles, many):
+        expected = recommender.recommend_jobs(profile, jobs, top_n=7)
+        assert [(id(r["job"]), r["match_score"]) for r in recommendations] == \
+               [(id(r["job"]), r["match_score"]) for r in expected]
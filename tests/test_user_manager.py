@@ -0,0 +1,17 @@
+from utils.user_manager import UserManager, create_user_profile_template
+
+
+def test_writes_keep_users_added_by_another_process(tmp_path):
+    users_file = str(tmp_path / "users.json")
+    app = UserManager(users_file)
+    app.create_user("a@example.com", "A", create_user_profile_template())
+
+    # Başka süreç (cli.py import-students) aynı dosyaya yazar
+    UserManager(users_file).create_users([
+        {"email": "b@example.com", "name": "B", "profile": create_user_profile_template()},
+    ])
+
+    assert [user["email"] for user in app.snapshot_users()] == ["a@example.com", "b@example.com"]
+
+    app.update_profile("a@example.com", {"city": "Ankara"})
+    assert set(UserManager(users_file).users) == {"a@example.com", "b@example.com"}
@@ -1,29 +1,65 @@
 import requests
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
+from utils.blob_store import BlobStore
+from utils.job_schema import format_raw_job
+from utils.rate_limit import RateLimitExceeded, SingleFlight, TokenBucket
+from utils.response_cache import TTLCache
 
 load_dotenv()
 
+# Tüm thread'ler ve Streamlit oturumları aynı süreçte bu nesneleri paylaşır
+_shared_limiter = TokenBucket(
+    rate=float(os.getenv("JSEARCH_RATE_PER_SEC", "1")),
+    capacity=float(os.getenv("JSEARCH_BURST", "5"))
+)
+_shared_inflight = SingleFlight()
+_shared_cache = TTLCache(ttl=float(os.getenv("JSEARCH_CACHE_TTL", "3600")))
+
 class JSearchClient:
     """JSearch API (RapidAPI) ile iş ilanlarını çeker"""
     
-    def __init__(self):
+    # Süreç genelinde arama dinleyicileri (ör. PrefetchScheduler); tüm örnekler paylaşır
+    search_listeners: List[Callable] = []
+    
+    def __init__(self, limiter: TokenBucket = None, max_wait: float = 10.0,
+                 lean: bool = False, blob_store: BlobStore = None,
+                 base_url: str = None, fixture_mode: str = None,
+                 fixture_dir: str = "data/fixtures", max_retries: int = 0,
+                 cache: TTLCache = None, timeout: float = None):
         self.api_key = os.getenv("RAPIDAPI_KEY")
-        self.base_url = "https://jsearch.p.rapidapi.com"
+        # JSEARCH_BASE_URL ile yerel sahte sunucuya (utils/jsearch_stub.py) yönlendirilebilir
+        self.base_url = base_url or os.getenv("JSEARCH_BASE_URL", "https://jsearch.p.rapidapi.com")
         self.headers = {
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": "jsearch.p.rapidapi.com"
         }
+        self.limiter = limiter if limiter is not None else _shared_limiter
+        self.max_wait = max_wait  # Bu süreden uzun kuyruk beklemesi yerine hata ver
+        self._inflight = _shared_inflight
+        # Lean modda ham veri ilanla taşınmaz, blob deposuna yazılır
+        self.lean = lean
+        self.blob_store = blob_store if blob_store is not None else (BlobStore() if lean else None)
+        # None: canlı, "record": yanıtları kaydet, "replay": ağ yerine kayıttan oku
+        self.fixture_mode = fixture_mode
+        self.fixture_dir = fixture_dir
+        self.max_retries = max_retries  # 5xx, bağlantı hatası ve zaman aşımında tekrar deneme
+        # Yanıt vermeyen sunucu arama thread'ini sonsuza kadar bekletmesin (saniye)
+        self.timeout = timeout if timeout is not None else float(os.getenv("JSEARCH_TIMEOUT", "15"))
+        # Boş TTLCache __len__ nedeniyle False sayılır; `or` kullanılmaz
+        self.cache = cache if cache is not None else _shared_cache
     
-    def search_jobs(self, query="part time student", location="Turkey", 
-                    num_pages=1, date_posted="today"):
-        """İş ilanlarını ara"""
-        
-        url = f"{self.base_url}/search"
+    def _build_params(self, query, location, page, num_pages, date_posted) -> Dict:
+        """API istek parametrelerini hazırla"""
         
         params = {
             "query": query,
-            "page": "1",
+            "page": str(page),
             "num_pages": str(num_pages),
             "date_posted": date_posted
         }
@@ -31,46 +67,241 @@ class JSearchClient:
         if location:
             params["query"] = f"{query} in {location}"
         
-        try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+        return params
+    
+    def _cache_key(self, params: Dict) -> Tuple:
+        """Önbellek ve istek birleştirme anahtarı"""
+        return (self.base_url,) + tuple(sorted(params.items()))
+    
+    def _request(self, params: Dict, refresh: bool = False) -> List[Dict]:
+        """Tek bir HTTP isteği at ve ham ilan listesini döndür
+        
+        Önbellekte taze yanıt varsa ağa çıkılmaz (refresh=True hariç).
+        Aynı parametrelerle eşzamanlı gelen çağrılar tek isteği paylaşır.
+        Bütçe tükendiğinde RateLimitExceeded fırlatılır.
+        """
+        
+        if self.fixture_mode == "replay":
+            return self._load_fixture(params)
+        
+        key = self._cache_key(params)
+        
+        if not refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        jobs = self._inflight.do(key, lambda: self._limited_request(params))
+        self.cache.set(key, jobs)
+        
+        if self.fixture_mode == "record":
+            self._save_fixture(params, jobs)
+        
+        return jobs
+    
+    def refresh(self, params: Dict) -> List[Dict]:
+        """Önbelleği atlayıp isteği yeniden yap (arka plan ön-yükleme için)"""
+        return self._request(params, refresh=True)
+    
+    def cache_age(self, params: Dict) -> Optional[float]:
+        """Bu isteğin önbellekteki yaşı (saniye), yoksa None"""
+        return self.cache.age(self._cache_key(params))
+    
+    def _notify_search(self, query, location, date_posted, params_list: List[Dict]):
+        """Kullanıcı aramasını dinleyicilere bildir"""
+        for listener in list(JSearchClient.search_listeners):
+            listener(query, location, date_posted, params_list)
+    
+    def _limited_request(self, params: Dict) -> List[Dict]:
+        """Hız sınırlayıcıdan token alıp isteği gönder"""
+        
+        url = f"{self.base_url}/search"
+        
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(self.max_wait)
             
-            data = response.json()
+            try:
+                response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+                continue
+            
+            if response.status_code == 429:
+                try:
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                except ValueError:
+                    retry_after = 1.0
+                raise RateLimitExceeded(retry_after)
+            
+            if response.status_code >= 500 and attempt < self.max_retries:
+                time.sleep(0.5 * 2 ** attempt)
+                continue
             
-            jobs = []
-            if "data" in data:
-                for job in data["data"]:
-                    formatted_job = self._format_job(job)
-                    jobs.append(formatted_job)
+            response.raise_for_status()
             
-            return jobs
+            data = response.json()
+            return data.get("data", [])
+    
+    def _fixture_path(self, params: Dict) -> str:
+        """Parametrelere göre kayıt dosyasının yolu"""
+        key = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.fixture_dir, f"search_{digest}.json")
+    
+    def _save_fixture(self, params: Dict, jobs: List[Dict]):
+        """Ham yanıtı kayıt dosyasına yaz"""
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(self._fixture_path(params), 'w', encoding='utf-8') as f:
+            json.dump({"params": params, "data": jobs}, f, ensure_ascii=False, indent=2)
+    
+    def _load_fixture(self, params: Dict) -> List[Dict]:
+        """Kayıtlı yanıtı oku; kayıt yoksa bağlantı hatası gibi davran"""
+        path = self._fixture_path(params)
+        if not os.path.exists(path):
+            raise requests.exceptions.ConnectionError(f"Kayıt bulunamadı: {path}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)["data"]
+    
+    def fetch_jobs(self, query="part time student", location="Turkey",
+                   num_pages=1, date_posted="today", refresh=False) -> List[Dict]:
+        """İlanları getir; hata yutulmaz (senkronizasyon gibi başarısızlığı bilmesi gerekenler için)
+        
+        refresh=True ise yanıt önbelleği atlanır ve ağdan taze veri alınır.
+        """
+        
+        params = self._build_params(query, location, 1, num_pages, date_posted)
+        return [self._format_job(job) for job in self._request(params, refresh=refresh)]
+    
+    def search_jobs(self, query="part time student", location="Turkey", 
+                    num_pages=1, date_posted="today"):
+        """İş ilanlarını ara"""
+        
+        params = self._build_params(query, location, 1, num_pages, date_posted)
+        self._notify_search(query, location, date_posted, [params])
+        
+        try:
+            return [self._format_job(job) for job in self._request(params)]
         
         except requests.exceptions.RequestException as e:
             print(f"API Hatası: {e}")
             return []
     
+    def search_jobs_stream(self, query="part time student", location="Turkey",
+                           num_pages=3, date_posted="today",
+                           max_workers=4, throttled: List[int] = None) -> Iterator[Dict]:
+        """Sayfaları paralel çek, her sayfa geldikçe ilanları tek tek ver
+        
+        Sayfalar tamamlanma sırasına göre gelir; ilk gelen sayfa diğerleri
+        yüklenirken işlenebilir. Hatalı ve hız sınırına takılan sayfalar
+        atlanır; takılan sayfa numaraları `throttled` listesine eklenir.
+        """
+        
+        page_params = [
+            self._build_params(query, location, page, 1, date_posted)
+            for page in range(1, num_pages + 1)
+        ]
+        self._notify_search(query, location, date_posted, page_params)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, num_pages)))
+        
+        try:
+            futures = {
+                executor.submit(self._request, params): page
+                for page, params in enumerate(page_params, 1)
+            }
+            
+            for future in as_completed(futures):
+                try:
+                    raw_jobs = future.result()
+                except RateLimitExceeded as e:
+                    print(f"Hız sınırı (sayfa {futures[future]}): {e.retry_after:.0f} sn")
+                    if throttled is not None:
+                        throttled.append(futures[future])
+                    continue
+                except requests.exceptions.RequestException as e:
+                    print(f"API Hatası (sayfa {futures[future]}): {e}")
+                    continue
+                
+                for job in raw_jobs:
+                    yield self._format_job(job)
+        finally:
+            # Tüketici erken bırakırsa bekleyen sayfaları iptal et
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def search_many(self, pairs: List[Tuple[str, str]], num_pages=1,
+                    date_posted="today", max_workers=4,
+                    throttled: List[Dict] = None) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
+        """Birden fazla (sorgu, konum) çiftini paralel ara, job_id ile tekilleştir
+        
+        Dönüş: (birleşik ilan listesi, {job_id: [{"query", "location"}, ...]})
+        id'si boş ilanlara "başlık|şirket" id'si verilir; köken bu id ile tutulur.
+        Sıra girdi çiftlerinin sırasına göre sabittir. Hız sınırına takılan
+        çift sonucu boş sayılır (diğer çiftlerin sonuçları korunur) ve
+        `throttled` listesine {"query", "location", "retry_after"} eklenir.
+        """
+        
+        pairs = list(dict.fromkeys(pairs))  # Tekrarlanan çiftleri at
+        if not pairs:
+            return [], {}
+        
+        def search_pair(pair):
+            try:
+                return self.search_jobs(
+                    query=pair[0],
+                    location=pair[1],
+                    num_pages=num_pages,
+                    date_posted=date_posted
+                )
+            except RateLimitExceeded as e:
+                print(f"Hız sınırı ({pair[0]} / {pair[1]}): {e.retry_after:.0f} sn")
+                if throttled is not None:
+                    throttled.append({"query": pair[0], "location": pair[1], "retry_after": e.retry_after})
+                return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+            results = list(executor.map(search_pair, pairs))
+        
+        jobs = {}
+        provenance = {}
+        for (query, location), pair_jobs in zip(pairs, results):
+            for job in pair_jobs:
+                job_id = job["id"] or f"{job['title']}|{job['company']}"
+                if not job["id"]:
+                    # Köken, sonuç önbelleği ve arayüz aynı anahtarla arasın (önbellekteki kayıt değişmesin)
+                    job = dict(job, id=job_id)
+                if job_id not in jobs:
+                    jobs[job_id] = job
+                    provenance[job_id] = []
+                match = {"query": query, "location": location}
+                if match not in provenance[job_id]:
+                    provenance[job_id].append(match)
+        
+        return list(jobs.values()), provenance
+    
     def _format_job(self, raw_job):
         """API'den gelen ham veriyi düzenle"""
         
-        return {
-            "id": raw_job.get("job_id", ""),
-            "title": raw_job.get("job_title", ""),
-            "company": raw_job.get("employer_name", ""),
-            "location": raw_job.get("job_city", "") or raw_job.get("job_country", ""),
-            "description": raw_job.get("job_description", ""),
-            "employment_type": raw_job.get("job_employment_type", ""),
-            "posted_date": raw_job.get("job_posted_at_datetime_utc", ""),
-            "salary": {
-                "min": raw_job.get("job_min_salary"),
-                "max": raw_job.get("job_max_salary"),
-                "currency": raw_job.get("job_salary_currency", "USD")
-            },
-            "required_skills": raw_job.get("job_required_skills", []),
-            "apply_link": raw_job.get("job_apply_link", ""),
-            "is_remote": raw_job.get("job_is_remote", False),
-            "job_google_link": raw_job.get("job_google_link", ""),
-            "raw_data": raw_job
-        }
+        job = format_raw_job(raw_job)
+        
+        if self.lean:
+            job["raw_ref"] = self.blob_store.put(raw_job)
+        else:
+            job["raw_data"] = raw_job
+        
+        return job
+    
+    def load_raw(self, job: Dict) -> Optional[Dict]:
+        """İlanın ham API verisini getir (lean modda diskten tembel yükler)"""
+        
+        if "raw_data" in job:
+            return job["raw_data"]
+        
+        if job.get("raw_ref") and self.blob_store:
+            return self.blob_store.get(job["raw_ref"])
+        
+        return None
 
 
 def test_api():
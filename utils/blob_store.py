@@ -0,0 +1,49 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+
+class BlobStore:
+    """İçerik adresli (SHA-256) JSON blob deposu
+
+    Aynı içerik her zaman aynı anahtara yazılır; bu yüzden aynı ham ilan
+    kaç oturumda görülürse görülsün diskte tek kopya tutulur.
+    """
+
+    def __init__(self, root="data/blobs"):
+        self.root = root
+
+    def _path(self, digest: str) -> str:
+        """Blob dosya yolu (ilk iki karakter alt klasör)"""
+        return os.path.join(self.root, digest[:2], f"{digest[2:]}.json")
+
+    def put(self, obj: Dict) -> str:
+        """Nesneyi kaydet ve içerik anahtarını döndür"""
+
+        payload = json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)  # Yarım yazılmış blob görünmesin
+
+        return digest
+
+    def get(self, digest: str) -> Optional[Dict]:
+        """Anahtara karşılık gelen nesneyi yükle"""
+
+        path = self._path(digest)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def exists(self, digest: str) -> bool:
+        """Blob diskte var mı"""
+        return os.path.exists(self._path(digest))
@@ -0,0 +1,266 @@
+import json
+import os
+import shutil
+import time
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+# Sayısal kolonlar: isim -> (dtype, eksik değer, ilandan okuma)
+NUMERIC_COLUMNS = {
+    "posted_timestamp": (np.int64, -1, lambda job: job.get("posted_timestamp")),
+    "latitude": (np.float64, np.nan, lambda job: job.get("latitude")),
+    "longitude": (np.float64, np.nan, lambda job: job.get("longitude")),
+    "salary_min": (np.float64, np.nan, lambda job: (job.get("salary") or {}).get("min")),
+    "salary_max": (np.float64, np.nan, lambda job: (job.get("salary") or {}).get("max")),
+    "is_remote": (np.uint8, 0, lambda job: job.get("is_remote")),
+    "is_active": (np.uint8, 1, lambda job: job.get("is_active", True)),
+}
+
+# Metin kolonları: isim -> ilandan okuma
+STRING_COLUMNS = {
+    "id": lambda job: job.get("id"),
+    "title": lambda job: job.get("title"),
+    "company": lambda job: job.get("company"),
+    "location": lambda job: job.get("location"),
+    "city": lambda job: job.get("city"),
+    "district": lambda job: job.get("district") or job.get("state"),
+    "category": lambda job: job.get("category"),
+    "employment_type": lambda job: job.get("employment_type"),
+    "posted_date": lambda job: job.get("posted_date"),
+    "apply_link": lambda job: job.get("apply_link"),
+    "salary_currency": lambda job: (job.get("salary") or {}).get("currency"),
+    "salary_period": lambda job: (job.get("salary") or {}).get("period"),
+    "required_skills": lambda job: "\x1f".join(job.get("required_skills") or []),
+}
+
+# Büyük metin ayrı blob'da: yalnızca açıklama istendiğinde sayfalar diske dokunur
+BLOB_COLUMNS = {
+    "description": lambda job: job.get("description"),
+}
+
+
+def _write_string_table(directory: str, name: str, values: List[str]):
+    """Metinleri tek bayt dosyasına, başlangıç ofsetlerini .npy'ye yaz"""
+
+    encoded = [(value or "").encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    with open(os.path.join(directory, f"{name}.bytes"), "wb") as f:
+        for b in encoded:
+            f.write(b)
+    np.save(os.path.join(directory, f"{name}.offsets.npy"), offsets)
+
+
+# Yayındaki sürümün adını tutan işaretçi dosyası
+CURRENT_FILE = "CURRENT"
+
+# Açık okuyucular eski sürümü okumaya devam edebilsin diye tutulan sürüm sayısı
+KEEP_VERSIONS = 2
+
+
+def current_version(directory: str) -> Optional[str]:
+    """Yayındaki sürüm klasörü (snapshot yoksa None)"""
+
+    pointer = os.path.join(directory, CURRENT_FILE)
+    if not os.path.exists(pointer):
+        return None
+    with open(pointer, "r", encoding="utf-8") as f:
+        return os.path.join(directory, f.read().strip())
+
+
+def _prune_versions(directory: str, keep: int = KEEP_VERSIONS):
+    """En yeni `keep` sürüm ve yayındaki sürüm dışındakileri sil"""
+
+    current = current_version(directory)
+    versions = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith("v") and os.path.isdir(os.path.join(directory, name))
+    )
+    for name in versions[:-keep]:
+        path = os.path.join(directory, name)
+        if path != current:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def write_snapshot(jobs: List[Dict], directory: str) -> str:
+    """İlanları kolon bazlı ikili snapshot olarak yaz, sürüm klasörünü döndür
+
+    Her yazım yeni bir sürüm klasörüne gider; yayın tek adımdır: CURRENT
+    işaretçisi os.replace ile değiştirilir. Okuyucu veya çökme hiçbir anda
+    snapshot'sız ya da yarım yazılmış bir sürüm görmez. Sürüm klasörleri
+    yazıldıktan sonra değişmez.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    name = f"v{time.time_ns()}-{os.getpid()}"
+    version_dir = os.path.join(directory, name)
+    os.makedirs(version_dir)
+
+    for column, (dtype, missing, read) in NUMERIC_COLUMNS.items():
+        values = [read(job) for job in jobs]
+        data = np.array([missing if v is None else v for v in values], dtype=dtype)
+        np.save(os.path.join(version_dir, f"{column}.npy"), data)
+
+    for column, read in {**STRING_COLUMNS, **BLOB_COLUMNS}.items():
+        _write_string_table(version_dir, column, [read(job) for job in jobs])
+
+    with open(os.path.join(version_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": SNAPSHOT_VERSION,
+            "count": len(jobs),
+            "created_at": time.time(),
+            "numeric_columns": list(NUMERIC_COLUMNS),
+            "string_columns": list(STRING_COLUMNS),
+            "blob_columns": list(BLOB_COLUMNS),
+        }, f, indent=2)
+
+    tmp_pointer = os.path.join(directory, f"{CURRENT_FILE}.tmp-{os.getpid()}")
+    with open(tmp_pointer, "w", encoding="utf-8") as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_pointer, os.path.join(directory, CURRENT_FILE))
+
+    _prune_versions(directory)
+    return version_dir
+
+
+class _StringTable:
+    """Ofset indeksli, bellek eşlemeli metin tablosu"""
+
+    def __init__(self, directory: str, name: str):
+        self.offsets = np.load(os.path.join(directory, f"{name}.offsets.npy"), mmap_mode="r")
+        path = os.path.join(directory, f"{name}.bytes")
+        # Boş dosya mmap edilemez
+        self.data = np.memmap(path, dtype=np.uint8, mode="r") if os.path.getsize(path) else np.empty(0, np.uint8)
+
+    def __getitem__(self, i: int) -> str:
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return bytes(self.data[start:end]).decode("utf-8")
+
+
+class CatalogSnapshot:
+    """Bellek eşlemeli (mmap) katalog snapshot okuyucusu
+
+    Açılış yalnızca meta.json okur ve dosyaları eşler; veri sayfaları
+    erişildikçe işletim sisteminden gelir. Aynı snapshot'ı açan işçi
+    süreçleri aynı sayfa önbelleğini paylaşır. Açılan sürüm sonradan
+    yazılan snapshot'lardan etkilenmez.
+    """
+
+    def __init__(self, directory: str):
+        # Snapshot kökü verilirse yayındaki sürüm açılır; sürüm klasörü doğrudan da verilebilir
+        self.directory = current_version(directory) or directory
+        directory = self.directory
+
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+
+        if self.meta["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Desteklenmeyen snapshot sürümü: {self.meta['version']}")
+
+        self.count = self.meta["count"]
+        self.columns = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in self.meta["numeric_columns"]
+        }
+        self.strings = {
+            name: _StringTable(directory, name)
+            for name in self.meta["string_columns"] + self.meta["blob_columns"]
+        }
+        self._id_index: Optional[Dict[str, int]] = None
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name: str) -> np.ndarray:
+        """Sayısal kolon (vektörel filtreleme için)"""
+        return self.columns[name]
+
+    def string(self, name: str, i: int) -> str:
+        """i. satırın metin değeri"""
+        return self.strings[name][i]
+
+    def index_of(self, job_id: str) -> Optional[int]:
+        """İlan id'sinin satır numarası (ilk çağrıda indeks kurulur)"""
+
+        if self._id_index is None:
+            ids = self.strings["id"]
+            self._id_index = {ids[i]: i for i in range(self.count)}
+        return self._id_index.get(job_id)
+
+    def get_job(self, i: int, with_description: bool = True) -> Dict:
+        """i. satırı ortak ilan şemasında dict olarak döndür"""
+
+        def num(name):
+            value = self.columns[name][i]
+            if name in ("is_remote", "is_active"):
+                return bool(value)
+            if name == "posted_timestamp":
+                return None if value < 0 else int(value)
+            return None if np.isnan(value) else float(value)
+
+        skills = self.string("required_skills", i)
+
+        job = {
+            "id": self.string("id", i),
+            "title": self.string("title", i),
+            "company": self.string("company", i),
+            "location": self.string("location", i),
+            "city": self.string("city", i),
+            "district": self.string("district", i),
+            "category": self.string("category", i),
+            "employment_type": self.string("employment_type", i),
+            "posted_date": self.string("posted_date", i),
+            "posted_timestamp": num("posted_timestamp"),
+            "latitude": num("latitude"),
+            "longitude": num("longitude"),
+            "salary": {
+                "min": num("salary_min"),
+                "max": num("salary_max"),
+                "currency": self.string("salary_currency", i),
+                "period": self.string("salary_period", i) or None
+            },
+            "required_skills": skills.split("\x1f") if skills else [],
+            "apply_link": self.string("apply_link", i),
+            "is_remote": num("is_remote"),
+            "is_active": num("is_active"),
+        }
+
+        if with_description:
+            job["description"] = self.string("description", i)
+
+        return job
+
+    def iter_jobs(self, with_description: bool = True) -> Iterator[Dict]:
+        """Tüm satırları sırayla üret"""
+        for i in range(self.count):
+            yield self.get_job(i, with_description)
+
+
+# Test
+if __name__ == "__main__":
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog("/tmp/jobmatch_catalog_test.json")
+    catalog.ingest_local_file("data/jobs.json")
+
+    start = time.perf_counter()
+    version_dir = write_snapshot(catalog.get_all_jobs(), "/tmp/jobmatch_snapshot")
+    print(f"💾 Snapshot yazıldı: {version_dir} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    start = time.perf_counter()
+    snapshot = CatalogSnapshot("/tmp/jobmatch_snapshot")
+    print(f"📂 Snapshot açıldı ({(time.perf_counter() - start) * 1000:.2f} ms), {len(snapshot)} ilan")
+
+    # Yeni sürüm yayınlansa da açık okuyucu kendi sürümünü görmeye devam eder
+    write_snapshot(catalog.get_all_jobs()[:10], "/tmp/jobmatch_snapshot")
+    print(f"🔀 Yeni sürüm: {len(CatalogSnapshot('/tmp/jobmatch_snapshot'))} ilan, açık okuyucu: {len(snapshot)} ilan")
+
+    active = int(snapshot.column("is_active").sum())
+    print(f"✅ Aktif ilan: {active}")
+    print(json.dumps(snapshot.get_job(0), ensure_ascii=False, indent=2))
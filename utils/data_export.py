@@ -1,88 +1,223 @@
-import pandas as pd
+import csv
+import io
+import os
+import zlib
 import json
 from datetime import datetime
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict
+
+# CSV'ler csv modülüyle, Excel openpyxl write-only moduyla satır satır yazılır;
+# openpyxl ve pyarrow yalnızca ilgili export çalışınca yüklenir.
+
+EXCEL_MAX_ROWS = 1_048_576  # Excel'in sayfa başına satır sınırı
 
 class DataExporter:
-    """Verileri CSV/Excel'e aktarma"""
+    """Verileri CSV/Excel'e aktarma
+
+    *_csv / excel_bytes metotları dosyayı bellekte üretir (indirme için);
+    export_* metotları aynı içeriği export_folder altına yazar.
+    """
+    
+    def __init__(self, export_folder="exports"):
+        self.export_folder = export_folder
+    
+    @staticmethod
+    def filename(prefix: str, extension: str) -> str:
+        """Zaman damgalı dosya adı (ör. users_export_20260108_171301.csv)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{prefix}_{timestamp}.{extension}"
     
-    def __init__(self):
-        self.export_folder = "exports"
+    def _csv_bytes(self, rows: List[Dict]) -> bytes:
+        """Satırları Excel'in tanıdığı UTF-8 BOM'lu CSV baytlarına çevir"""
+        return b''.join(self.iter_csv(rows))
+    
+    def _write(self, filename: str, data: bytes) -> str:
+        """Baytları export klasörüne yaz, dosya yolunu döndür"""
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, filename)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+    
+    def iter_csv(self, rows: Iterable[Dict], chunk_size: int = 1000,
+                 compress: bool = False) -> Iterator[bytes]:
+        """Satırları chunk_size'lık parçalar halinde CSV baytları olarak üret
         
-    def export_users_to_csv(self, users_data: Dict) -> str:
-        """Kullanıcıları CSV'ye aktar"""
+        Bellekte aynı anda yalnızca bir parça bulunur. compress=True ise
+        çıktı gzip akışıdır (.csv.gz).
+        """
         
-        # Kullanıcı verilerini düzleştir (flatten)
-        rows = []
-        for email, user in users_data.items():
-            profile = user.get('profile', {})
+        gzip = zlib.compressobj(wbits=31) if compress else None  # 31: gzip başlığı
+        buffer = io.StringIO()
+        writer = None
+        pending = 0
+        
+        def flush(data: str) -> bytes:
+            encoded = data.encode('utf-8')
+            return gzip.compress(encoded) if gzip else encoded
+        
+        # Excel'in UTF-8'i tanıması için BOM (utf-8-sig ile aynı)
+        buffer.write('\ufeff')
+        
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row), lineterminator='\n')
+                writer.writeheader()
+            writer.writerow(row)
+            pending += 1
             
-            row = {
-                'ID': user.get('id'),
-                'Name': user.get('name'),
-                'Email': user.get('email'),
-                'Created At': user.get('created_at', '')[:10],
-                'Age': profile.get('age'),
-                'City': profile.get('city'),
-                'District': profile.get('district'),
-                'University': profile.get('university'),
-                'Skills': ', '.join(profile.get('skills', [])),
-                'Education Level': profile.get('education_level'),
-                'Department': profile.get('department'),
-                'GPA': profile.get('gpa'),
-                'Min Hourly Wage': profile.get('min_hourly_wage'),
-                'Max Distance (km)': profile.get('max_distance_km'),
-                'Preferred Job Types': ', '.join(profile.get('preferred_job_types', [])),
-                'Remote Preference': profile.get('remote_preference'),
-                'Experience (months)': profile.get('experience_months'),
-                'Total Applications': len(user.get('application_history', []))
-            }
-            rows.append(row)
+            if pending >= chunk_size:
+                chunk = flush(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+                if chunk:
+                    yield chunk
         
-        df = pd.DataFrame(rows)
+        chunk = flush(buffer.getvalue())
+        if chunk:
+            yield chunk
+        if gzip:
+            yield gzip.flush()
+    
+    def write_stream(self, chunks: Iterable[bytes], filename: str) -> str:
+        """Parça akışını export klasörüne yaz, dosya yolunu döndür"""
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, filename)
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return path
+    
+    def user_row(self, user: Dict) -> Dict:
+        """Tek kullanıcıyı düz satıra çevir"""
         
-        # CSV'ye kaydet
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"users_export_{timestamp}.csv"
+        profile = user.get('profile', {})
         
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        return filename
+        return {
+            'ID': user.get('id'),
+            'Name': user.get('name'),
+            'Email': user.get('email'),
+            'Created At': user.get('created_at', '')[:10],
+            'Age': profile.get('age'),
+            'City': profile.get('city'),
+            'District': profile.get('district'),
+            'University': profile.get('university'),
+            'Skills': ', '.join(profile.get('skills', [])),
+            'Education Level': profile.get('education_level'),
+            'Department': profile.get('department'),
+            'GPA': profile.get('gpa'),
+            'Min Hourly Wage': profile.get('min_hourly_wage'),
+            'Max Distance (km)': profile.get('max_distance_km'),
+            'Preferred Job Types': ', '.join(profile.get('preferred_job_types', [])),
+            'Remote Preference': profile.get('remote_preference'),
+            'Experience (months)': profile.get('experience_months'),
+            'Total Applications': len(user.get('application_history', []))
+        }
+    
+    def user_rows(self, users_data: Dict) -> List[Dict]:
+        """Kullanıcıları düz satırlara çevir"""
+        return [self.user_row(user) for user in users_data.values()]
+    
+    def iter_users_csv(self, users: Iterable[Dict], chunk_size: int = 1000,
+                       compress: bool = False) -> Iterator[bytes]:
+        """Kullanıcı CSV'si parça parça (ör. UserManager.iter_users())"""
+        return self.iter_csv((self.user_row(user) for user in users), chunk_size, compress)
+    
+    def users_csv(self, users_data: Dict) -> bytes:
+        """Kullanıcı CSV'si (bellekte)"""
+        return self._csv_bytes(self.user_rows(users_data))
+    
+    def export_users_to_csv(self, users_data: Dict) -> str:
+        """Kullanıcıları CSV'ye aktar"""
+        return self._write(self.filename("users_export", "csv"), self.users_csv(users_data))
+    
+    def job_row(self, job: Dict) -> Dict:
+        """Tek ilanı düz satıra çevir"""
+        
+        return {
+            'Job ID': job.get('id'),
+            'Title': job.get('title'),
+            'Company': job.get('company'),
+            'Location': job.get('location'),
+            'City': job.get('city') or job.get('job_city'),
+            'State': job.get('state') or job.get('job_state'),
+            'Country': job.get('country') or job.get('job_country'),
+            'Employment Type': job.get('employment_type'),
+            'Is Remote': 'Yes' if job.get('is_remote') else 'No',
+            'Posted Date': job.get('posted_date', '')[:10],
+            'Min Salary': job.get('salary', {}).get('min'),
+            'Max Salary': job.get('salary', {}).get('max'),
+            'Currency': job.get('salary', {}).get('currency'),
+            'Required Skills': ', '.join(job.get('required_skills', [])),
+            'Apply Link': job.get('apply_link'),
+            'Description': job.get('description', '')[:200] + '...',  # İlk 200 karakter
+            # Artımlı export'ta pasifleşen/tekrar işaretlenen ilanlar da aktarılır
+            'Is Active': 'Yes' if job.get('is_active', True) else 'No',
+            'Duplicate Of': job.get('duplicate_of') or ''
+        }
+    
+    def job_rows(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """İş ilanlarını düz satırlara çevir"""
+        return [self.job_row(job) for job in jobs]
+    
+    def iter_jobs_csv(self, jobs: Iterable[Dict], chunk_size: int = 1000,
+                      compress: bool = False) -> Iterator[bytes]:
+        """İlan CSV'si parça parça (ör. JobCatalog.iter_jobs() veya CatalogSnapshot.iter_jobs())"""
+        return self.iter_csv((self.job_row(job) for job in jobs), chunk_size, compress)
+    
+    def jobs_csv(self, jobs: List[Dict]) -> bytes:
+        """İlan CSV'si (bellekte)"""
+        return self._csv_bytes(self.job_rows(jobs))
     
     def export_jobs_to_csv(self, jobs: List[Dict]) -> str:
         """İş ilanlarını CSV'ye aktar"""
+        return self._write(self.filename("jobs_export", "csv"), self.jobs_csv(jobs))
+    
+    def users_parquet(self, users: Iterable[Dict], row_group_size: int = 50_000,
+                      compression: str = "zstd") -> bytes:
+        """Tipli kullanıcı tablosu Parquet olarak (bellekte)"""
+        from utils.parquet_export import USER_SCHEMA, user_record, write_parquet
         
-        rows = []
-        for job in jobs:
-            row = {
-                'Job ID': job.get('id'),
-                'Title': job.get('title'),
-                'Company': job.get('company'),
-                'Location': job.get('location'),
-                'City': job.get('job_city'),
-                'State': job.get('job_state'),
-                'Country': job.get('job_country'),
-                'Employment Type': job.get('employment_type'),
-                'Is Remote': 'Yes' if job.get('is_remote') else 'No',
-                'Posted Date': job.get('posted_date', '')[:10],
-                'Min Salary': job.get('salary', {}).get('min'),
-                'Max Salary': job.get('salary', {}).get('max'),
-                'Currency': job.get('salary', {}).get('currency'),
-                'Required Skills': ', '.join(job.get('required_skills', [])),
-                'Apply Link': job.get('apply_link'),
-                'Description': job.get('description', '')[:200] + '...'  # İlk 200 karakter
-            }
-            rows.append(row)
+        buffer = io.BytesIO()
+        write_parquet((user_record(user) for user in users), USER_SCHEMA, buffer,
+                      row_group_size, compression)
+        return buffer.getvalue()
+    
+    def jobs_parquet(self, jobs: Iterable[Dict], row_group_size: int = 50_000,
+                     compression: str = "zstd") -> bytes:
+        """Tipli ilan tablosu Parquet olarak (bellekte)"""
+        from utils.parquet_export import JOB_SCHEMA, job_record, write_parquet
         
-        df = pd.DataFrame(rows)
+        buffer = io.BytesIO()
+        write_parquet((job_record(job) for job in jobs), JOB_SCHEMA, buffer,
+                      row_group_size, compression)
+        return buffer.getvalue()
+    
+    def export_users_to_parquet(self, users: Iterable[Dict], row_group_size: int = 50_000,
+                                compression: str = "zstd") -> str:
+        """Kullanıcıları doğrudan dosyaya Parquet olarak aktar (row group başına bellek)"""
+        from utils.parquet_export import USER_SCHEMA, user_record, write_parquet
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"jobs_export_{timestamp}.csv"
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, self.filename("users_export", "parquet"))
+        write_parquet((user_record(user) for user in users), USER_SCHEMA, path,
+                      row_group_size, compression)
+        return path
+    
+    def export_jobs_to_parquet(self, jobs: Iterable[Dict], row_group_size: int = 50_000,
+                               compression: str = "zstd") -> str:
+        """İlanları doğrudan dosyaya Parquet olarak aktar (row group başına bellek)"""
+        from utils.parquet_export import JOB_SCHEMA, job_record, write_parquet
         
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        return filename
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, self.filename("jobs_export", "parquet"))
+        write_parquet((job_record(job) for job in jobs), JOB_SCHEMA, path,
+                      row_group_size, compression)
+        return path
     
-    def export_recommendations_to_csv(self, recommendations: List[Dict]) -> str:
-        """AI önerilerini CSV'ye aktar"""
+    def recommendation_rows(self, recommendations: List[Dict]) -> List[Dict]:
+        """AI önerilerini düz satırlara çevir"""
         
         rows = []
         for rec in recommendations:
@@ -104,28 +239,25 @@ class DataExporter:
             }
             rows.append(row)
         
-        df = pd.DataFrame(rows)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"recommendations_export_{timestamp}.csv"
-        
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        return filename
+        return rows
     
-    def export_to_excel(self, users_data: Dict, jobs: List[Dict], 
-                       recommendations: List[Dict] = None) -> str:
-        """Tüm verileri tek Excel dosyasına aktar (multiple sheets)"""
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"jobmatch_data_export_{timestamp}.xlsx"
+    def recommendations_csv(self, recommendations: List[Dict]) -> bytes:
+        """Öneri CSV'si (bellekte)"""
+        return self._csv_bytes(self.recommendation_rows(recommendations))
+    
+    def export_recommendations_to_csv(self, recommendations: List[Dict]) -> str:
+        """AI önerilerini CSV'ye aktar"""
+        return self._write(self.filename("recommendations_export", "csv"),
+                           self.recommendations_csv(recommendations))
+    
+    def excel_sheets(self, users: Iterable[Dict], jobs: Iterable[Dict],
+                     recommendations: Iterable[Dict] = None) -> Dict[str, Iterator[Dict]]:
+        """Excel sayfaları: sayfa adı -> satır üreteci"""
         
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            
-            # Sheet 1: Users
-            user_rows = []
-            for email, user in users_data.items():
+        def user_rows():
+            for user in users:
                 profile = user.get('profile', {})
-                user_rows.append({
+                yield {
                     'ID': user.get('id'),
                     'Name': user.get('name'),
                     'Email': user.get('email'),
@@ -134,43 +266,89 @@ class DataExporter:
                     'Skills': ', '.join(profile.get('skills', [])),
                     'Min Wage': profile.get('min_hourly_wage'),
                     'Applications': len(user.get('application_history', []))
-                })
-            
-            df_users = pd.DataFrame(user_rows)
-            df_users.to_excel(writer, sheet_name='Users', index=False)
-            
-            # Sheet 2: Jobs
-            job_rows = []
+                }
+        
+        def job_rows():
             for job in jobs:
-                job_rows.append({
+                yield {
                     'Title': job.get('title'),
                     'Company': job.get('company'),
                     'Location': job.get('location'),
                     'Type': job.get('employment_type'),
                     'Remote': 'Yes' if job.get('is_remote') else 'No',
                     'Posted': job.get('posted_date', '')[:10]
-                })
-            
-            df_jobs = pd.DataFrame(job_rows)
-            df_jobs.to_excel(writer, sheet_name='Jobs', index=False)
+                }
+        
+        def rec_rows():
+            for rec in recommendations:
+                job = rec['job']
+                yield {
+                    'Score': rec['match_score'],
+                    'Job': job.get('title'),
+                    'Company': job.get('company'),
+                    'Location': job.get('location')
+                }
+        
+        sheets = {'Users': user_rows(), 'Jobs': job_rows()}
+        if recommendations:
+            sheets['Recommendations'] = rec_rows()
+        return sheets
+    
+    def write_excel(self, sink, sheets: Dict[str, Iterable[Dict]],
+                    max_rows: int = EXCEL_MAX_ROWS) -> Dict[str, int]:
+        """Sayfaları write-only çalışma kitabına satır satır yaz
+        
+        Satırlar üretildikçe diske akar, bellek sayfa boyutundan bağımsızdır.
+        Bir sayfa max_rows'a (başlık dahil) ulaşınca "Ad (2)" gibi yeni bir
+        sayfaya başlık tekrarlanarak devam edilir. Sayfa başına yazılan
+        satır sayısını döndürür.
+        """
+        
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        written = {}
+        
+        for name, rows in sheets.items():
+            sheet, header = None, None
+            sheet_rows, part = 0, 0
+            written[name] = 0
             
-            # Sheet 3: Recommendations (if available)
-            if recommendations:
-                rec_rows = []
-                for rec in recommendations:
-                    job = rec['job']
-                    rec_rows.append({
-                        'Score': rec['match_score'],
-                        'Job': job.get('title'),
-                        'Company': job.get('company'),
-                        'Location': job.get('location')
-                    })
+            for row in rows:
+                if header is None:
+                    header = list(row)
+                if sheet is None or sheet_rows >= max_rows:
+                    part += 1
+                    sheet = workbook.create_sheet(name if part == 1 else f"{name} ({part})")
+                    sheet.append(header)
+                    sheet_rows = 1
                 
-                df_recs = pd.DataFrame(rec_rows)
-                df_recs.to_excel(writer, sheet_name='Recommendations', index=False)
+                sheet.append([row.get(column) for column in header])
+                sheet_rows += 1
+                written[name] += 1
+            
+            if sheet is None:
+                workbook.create_sheet(name)
         
-        return filename
-
+        workbook.save(sink)
+        return written
+    
+    def excel_bytes(self, users_data: Dict, jobs: List[Dict], 
+                    recommendations: List[Dict] = None) -> bytes:
+        """Tüm veriler tek Excel çalışma kitabında (bellekte, multiple sheets)"""
+        
+        buffer = io.BytesIO()
+        self.write_excel(buffer, self.excel_sheets(users_data.values(), jobs, recommendations))
+        return buffer.getvalue()
+    
+    def export_to_excel(self, users_data: Dict, jobs: Iterable[Dict], 
+                       recommendations: List[Dict] = None) -> str:
+        """Tüm verileri tek Excel dosyasına aktar (multiple sheets, sabit bellek)"""
+        
+        os.makedirs(self.export_folder, exist_ok=True)
+        path = os.path.join(self.export_folder, self.filename("jobmatch_data_export", "xlsx"))
+        self.write_excel(path, self.excel_sheets(users_data.values(), jobs, recommendations))
+        return path
 
 # Test
 if __name__ == "__main__":
@@ -193,5 +371,28 @@ if __name__ == "__main__":
         }
     }
     
-    filename = exporter.export_users_to_csv(test_users)
-    print(f"✅ CSV oluşturuldu: {filename}")
\ No newline at end of file
+    data = exporter.users_csv(test_users)
+    print(f"✅ CSV bellekte oluşturuldu: {len(data)} bayt")
+    print(data.decode('utf-8-sig'))
+    
+    # Akış: 100.000 kullanıcı, bellekte yalnızca bir parça
+    import tracemalloc
+    
+    def many_users(n):
+        for i in range(n):
+            user = dict(test_users["test@student.com"], id=f"U{i:06d}", email=f"user{i}@student.com")
+            yield user
+    
+    tracemalloc.start()
+    total = 0
+    for chunk in exporter.iter_users_csv(many_users(100_000), chunk_size=1000, compress=True):
+        total += len(chunk)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"✅ 100.000 kullanıcı gzip CSV: {total / 1024:.0f} KB, bellek tepe noktası {peak / 1024:.0f} KB")
+    
+    # Excel: sayfa sınırı aşılınca yeni sayfaya geçilir
+    buffer = io.BytesIO()
+    written = exporter.write_excel(buffer, exporter.excel_sheets(many_users(25), []), max_rows=10)
+    from openpyxl import load_workbook
+    print(f"✅ Excel: {written}, sayfalar: {load_workbook(buffer, read_only=True).sheetnames}")
\ No newline at end of file
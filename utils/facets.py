@@ -0,0 +1,130 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+# Facet adı -> arayüzde gösterilecek etiket
+FACET_LABELS = {
+    "category": "📂 Kategori",
+    "city": "🏙️ Şehir",
+    "district": "📍 İlçe",
+    "employment_type": "💼 Çalışma Tipi",
+    "remote": "🏠 Remote",
+    "salary_band": "💰 Saatlik Ücret",
+}
+
+# Saatlik ücret bantları (alt sınır, etiket); büyükten küçüğe kontrol edilir
+SALARY_BANDS = [
+    (150, "₺150+"),
+    (100, "₺100-150"),
+    (75, "₺75-100"),
+    (0, "₺0-75"),
+]
+
+
+def hourly_salary(job: Dict) -> Optional[float]:
+    """İlanın saatlik ücreti (yıllık/aylık ise yaklaşık çevrilir)"""
+
+    salary = job.get("salary") or {}
+    amount = salary.get("min") or salary.get("max") or job.get("hourly_wage")
+    if not amount:
+        return None
+
+    period = (salary.get("period") or "HOUR").upper()
+    if period == "YEAR":
+        return amount / (52 * 40)
+    if period == "MONTH":
+        return amount / (4 * 40)
+    return float(amount)
+
+
+def salary_band(job: Dict) -> str:
+    """Saatlik ücret bandı etiketi"""
+
+    hourly = hourly_salary(job)
+    if hourly is None:
+        return "Belirtilmemiş"
+
+    for lower, label in SALARY_BANDS:
+        if hourly >= lower:
+            return label
+    return SALARY_BANDS[-1][1]
+
+
+def facet_values(job: Dict) -> Dict[str, str]:
+    """İlanın her facet için değeri (boş değerler atlanır)"""
+
+    values = {
+        "category": job.get("category"),
+        "city": job.get("city") or job.get("location"),
+        "district": job.get("district") or job.get("state"),
+        "employment_type": job.get("employment_type"),
+        "remote": "Remote" if job.get("is_remote") else "Yerinde",
+        "salary_band": salary_band(job),
+    }
+    return {facet: value for facet, value in values.items() if value}
+
+
+class FacetIndex:
+    """Artımlı güncellenen facet sayaçları
+
+    Her (facet, değer) için ilan id kümesi tutulur; sayılar küme
+    boyutlarıdır, bu yüzden ekleme/çıkarma O(facet sayısı) maliyetlidir ve
+    sayım için sonuçların yeniden taranması gerekmez. Drill-down filtreleme
+    küme kesişimidir.
+    """
+
+    def __init__(self, jobs: Iterable[Dict] = ()):
+        self.postings: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        self._values: Dict[str, Dict[str, str]] = {}  # job_id -> facet değerleri
+
+        for job in jobs:
+            self.add(job)
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, job: Dict):
+        """İlanı sayaçlara ekle (varsa önce çıkarılır)"""
+
+        job_id = job["id"]
+        if job_id in self._values:
+            self.remove(job_id)
+
+        values = facet_values(job)
+        self._values[job_id] = values
+        for facet, value in values.items():
+            self.postings[facet][value].add(job_id)
+
+    def remove(self, job_id: str):
+        """İlanı sayaçlardan çıkar"""
+
+        values = self._values.pop(job_id, None)
+        if not values:
+            return
+
+        for facet, value in values.items():
+            ids = self.postings[facet][value]
+            ids.discard(job_id)
+            if not ids:
+                del self.postings[facet][value]
+
+    def counts(self, facet: str, within: set = None) -> Dict[str, int]:
+        """Facet değer sayıları; within verilirse yalnızca o id'ler içinde"""
+
+        if within is None:
+            return {value: len(ids) for value, ids in self.postings[facet].items()}
+
+        counts = {value: len(ids & within) for value, ids in self.postings[facet].items()}
+        return {value: count for value, count in counts.items() if count}
+
+    def filter(self, selections: Dict[str, List[str]]) -> set:
+        """Seçimlere uyan id'ler (facet içinde VEYA, facet'ler arası VE)"""
+
+        result = set(self._values)
+        for facet, values in selections.items():
+            if not values:
+                continue
+            matching = set()
+            for value in values:
+                matching |= self.postings[facet].get(value, set())
+            result &= matching
+        return result
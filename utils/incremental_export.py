@@ -0,0 +1,156 @@
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional
+
+from utils.data_export import DataExporter
+
+DATASETS = ("users", "jobs")
+
+
+def change_time(record: Dict) -> float:
+    """Kaydın son değişiklik zamanı (epoch); updated_at yoksa oluşturulma zamanı"""
+
+    value = record.get("updated_at") or record.get("created_at") or record.get("first_seen_at")
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return 0.0
+
+
+class IncrementalExporter:
+    """Yalnızca son export'tan bu yana değişen kayıtları dışa aktarır
+
+    Her veri kümesi (users, jobs) için bir su seviyesi (watermark) tutulur;
+    bir çalıştırma (watermark, başlangıç zamanı] aralığında değişen
+    kayıtları yazar ve aralığı manifest'e ekler. Dosya yazılmadan
+    manifest güncellenmez, bu yüzden yarıda kalan çalıştırma aynı aralığı
+    bir sonraki seferde yeniden üretir.
+
+    İlanlar pasif ve tekrar işaretli olanlar dahil verilmelidir
+    (`iter_jobs(active_only=False, include_duplicates=True)`); aksi halde
+    bu durum değişiklikleri filtrelenir ve watermark üzerlerinden geçer.
+    """
+
+    def __init__(self, exporter: DataExporter = None, manifest_file: str = None):
+        self.exporter = exporter or DataExporter()
+        self.manifest_file = manifest_file or os.path.join(self.exporter.export_folder, "manifest.json")
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        if os.path.exists(self.manifest_file):
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {"watermarks": {}, "exports": []}
+
+    def _save_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_file) or ".", exist_ok=True)
+        tmp_file = f"{self.manifest_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+
+    def watermark(self, dataset: str) -> float:
+        """Veri kümesinin son export edilen değişiklik zamanı (hiç yoksa 0)"""
+        return self.manifest["watermarks"].get(dataset, 0.0)
+
+    def changed(self, records: Iterable[Dict], since: float, until: float) -> Iterator[Dict]:
+        """since < değişiklik zamanı <= until olan kayıtlar"""
+        for record in records:
+            if since < change_time(record) <= until:
+                yield record
+
+    def export(self, dataset: str, records: Iterable[Dict], file_format: str = "csv",
+               compress: bool = False, full: bool = False, until: float = None) -> Optional[Dict]:
+        """Değişen kayıtları yaz, manifest kaydını döndür (değişiklik yoksa None)
+
+        full=True ise watermark yok sayılır ve tüm kayıtlar yazılır.
+        """
+
+        if dataset not in DATASETS:
+            raise ValueError(f"Bilinmeyen veri kümesi: {dataset}")
+
+        since = 0.0 if full else self.watermark(dataset)
+        until = until or time.time()
+        counter = {"rows": 0}
+
+        def counted(rows):
+            for row in rows:
+                counter["rows"] += 1
+                yield row
+
+        changes = counted(self.changed(records, since, until))
+        stamp = datetime.fromtimestamp(until).strftime("%Y%m%d_%H%M%S")
+        os.makedirs(self.exporter.export_folder, exist_ok=True)
+
+        if file_format == "csv":
+            filename = f"{dataset}_changes_{stamp}.csv" + (".gz" if compress else "")
+            if dataset == "users":
+                chunks = self.exporter.iter_users_csv(changes, compress=compress)
+            else:
+                chunks = self.exporter.iter_jobs_csv(changes, compress=compress)
+            path = self.exporter.write_stream(chunks, filename)
+        elif file_format == "parquet":
+            from utils.parquet_export import JOB_SCHEMA, USER_SCHEMA, job_record, user_record, write_parquet
+
+            filename = f"{dataset}_changes_{stamp}.parquet"
+            path = os.path.join(self.exporter.export_folder, filename)
+            if dataset == "users":
+                write_parquet((user_record(r) for r in changes), USER_SCHEMA, path)
+            else:
+                write_parquet((job_record(r) for r in changes), JOB_SCHEMA, path)
+        else:
+            raise ValueError(f"Desteklenmeyen format: {file_format}")
+
+        if counter["rows"] == 0:
+            os.remove(path)
+            entry = None
+        else:
+            entry = {
+                "dataset": dataset,
+                "from": since,
+                "to": until,
+                "rows": counter["rows"],
+                "path": path,
+                "format": file_format,
+                "full": full,
+                "created_at": time.time(),
+            }
+            self.manifest["exports"].append(entry)
+
+        # Değişiklik olmasa da aralık tamamlandı: watermark ilerler
+        self.manifest["watermarks"][dataset] = until
+        self._save_manifest()
+        return entry
+
+
+# Test
+if __name__ == "__main__":
+    import tempfile
+
+    from utils.job_catalog import JobCatalog
+    from utils.user_manager import UserManager
+
+    folder = tempfile.mkdtemp(prefix="jobmatch_exports_")
+    incremental = IncrementalExporter(DataExporter(folder))
+
+    users = UserManager()
+    catalog = JobCatalog(os.path.join(folder, "catalog.json"))
+    catalog.ingest_local_file("data/jobs.json")
+
+    for attempt in range(2):
+        jobs = catalog.iter_jobs(active_only=False, include_duplicates=True)
+        for dataset, records in (("users", users.iter_users()), ("jobs", jobs)):
+            entry = incremental.export(dataset, records, compress=True)
+            rows = entry["rows"] if entry else 0
+            print(f"#{attempt + 1} {dataset}: {rows} değişen kayıt")
+
+        # İkinci turdan önce tek bir ilan değişsin
+        catalog.expire_jobs([next(iter(catalog.jobs))])
+
+    print(json.dumps(incremental.manifest["watermarks"], indent=2))
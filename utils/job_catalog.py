@@ -0,0 +1,288 @@
+import bisect
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.facets import FacetIndex
+from utils.job_schema import DATE_POSTED_DAYS, normalize_job
+
+
+def posting_day(job: Dict) -> str:
+    """İlanın yayın günü (UTC, YYYY-MM-DD); bilinmiyorsa boş"""
+
+    timestamp = job.get("posted_timestamp")
+    if timestamp:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+    return (job.get("posted_date") or "")[:10]
+
+
+# Katalogun kendi tuttuğu alanlar; ilan içeriği değişti mi karşılaştırmasına girmez
+BOOKKEEPING_FIELDS = {
+    "first_seen_at", "last_seen_at", "updated_at", "sources",
+    "is_active", "expired_at", "duplicate_of",
+}
+
+
+def content_of(job: Dict) -> Dict:
+    """İlanın katalog alanları hariç içeriği"""
+    return {key: value for key, value in job.items() if key not in BOOKKEEPING_FIELDS}
+
+
+class JobCatalog:
+    """Yerel kalıcı iş ilanı kataloğu (API'ye gitmeden kullanılabilir)
+
+    data/jobs.json kayıtları ve JSearch sonuçları tek bir şemaya
+    (utils/job_schema.normalize_job) çevrilerek saklanır.
+
+    Bellekte yayın gününe göre bölümler (gün -> id kümesi), aktif ilan id
+    kümesi ve aktif/tekil ilanların facet sayaçları tutulur. Tarih
+    pencereli sorgular yalnızca pencereye düşen bölümleri okur; pasif
+    ilanlar hiç dönmez.
+    """
+
+    def __init__(self, data_file="data/job_catalog.json"):
+        self.data_file = data_file
+        self.jobs = self._load_jobs()
+        self._rebuild_indexes()
+
+    def _load_jobs(self) -> Dict:
+        """İlanları dosyadan yükle"""
+        if os.path.exists(self.data_file):
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _rebuild_indexes(self):
+        """Bölüm ve aktif ilan indekslerini baştan kur"""
+
+        self._partitions: Dict[str, set] = defaultdict(set)
+        self._partition_days: List[str] = []
+        self._active_ids = set()
+        self.facets = FacetIndex()
+
+        for job in self.jobs.values():
+            self._index_job(job)
+
+    def _index_job(self, job: Dict):
+        """Tek ilanı indekslere ekle"""
+
+        day = posting_day(job)
+        if day not in self._partitions:
+            bisect.insort(self._partition_days, day)
+        self._partitions[day].add(job["id"])
+
+        if job.get("is_active", True):
+            self._active_ids.add(job["id"])
+        else:
+            self._active_ids.discard(job["id"])
+
+        if job.get("is_active", True) and not job.get("duplicate_of"):
+            self.facets.add(job)
+        else:
+            self.facets.remove(job["id"])
+
+    def _unindex_job(self, job: Dict):
+        """Tek ilanı indekslerden çıkar"""
+
+        day = posting_day(job)
+        self._partitions[day].discard(job["id"])
+        if not self._partitions[day]:
+            del self._partitions[day]
+            self._partition_days.remove(day)
+        self._active_ids.discard(job["id"])
+        self.facets.remove(job["id"])
+
+    def save(self):
+        """İlanları dosyaya kaydet"""
+        os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+        tmp_file = f"{self.data_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.jobs, f, ensure_ascii=False)
+        os.replace(tmp_file, self.data_file)
+
+    def upsert_jobs(self, jobs: List[Dict], source: str = None,
+                    seen_at: float = None) -> Tuple[int, int]:
+        """İlanları normalize edip ekle/güncelle, (eklenen, güncellenen) döndür"""
+
+        seen_at = seen_at or time.time()
+        added = updated = 0
+
+        for job in jobs:
+            job_id = job.get("id") or job.get("job_id")
+            if not job_id:
+                continue
+
+            # Ham veri katalogda tutulmaz (lean modda zaten raw_ref var)
+            record = normalize_job(job)
+            existing = self.jobs.get(job_id)
+
+            if existing:
+                record["first_seen_at"] = existing.get("first_seen_at", seen_at)
+                sources = existing.get("sources", [])
+                updated += 1
+                # İçerik aynıysa ve ilan zaten aktifse değişiklik zamanı korunur
+                changed = (content_of(record) != content_of(existing)
+                           or existing.get("is_active", True) != record.get("is_active", True))
+                record["updated_at"] = seen_at if changed else existing.get("updated_at", existing["first_seen_at"])
+            else:
+                record["first_seen_at"] = seen_at
+                record["updated_at"] = seen_at
+                sources = []
+                added += 1
+
+            if source and source not in sources:
+                sources = sources + [source]
+
+            record["sources"] = sources
+            record["last_seen_at"] = seen_at
+            record["is_active"] = record.get("is_active", True)
+            record.pop("expired_at", None)
+            # Tekrar işareti bir sonraki dedupe'a kadar korunur
+            if existing and existing.get("duplicate_of"):
+                record["duplicate_of"] = existing["duplicate_of"]
+
+            if existing:
+                self._unindex_job(existing)
+            self.jobs[job_id] = record
+            self._index_job(record)
+
+        return added, updated
+
+    def ingest_local_file(self, path="data/jobs.json") -> Tuple[int, int]:
+        """data/jobs.json biçimindeki dosyayı kataloğa al"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.upsert_jobs(json.load(f), source=f"file:{os.path.basename(path)}")
+
+    def save_snapshot(self, directory="data/catalog_snapshot") -> str:
+        """Kataloğun kolon bazlı, mmap ile açılabilen snapshot'ını yaz (yeni sürüm klasörünü döndürür)"""
+        from utils.catalog_snapshot import write_snapshot
+        return write_snapshot(self.get_all_jobs(), directory)
+
+    def dedupe(self, detector=None, changed_at: float = None) -> int:
+        """Neredeyse aynı aktif ilanları işaretle, tekrar sayısını döndür
+
+        Her grupta en dolu (eşitse en önce görülen) ilan kalır; diğerlerine
+        `duplicate_of` yazılır ve get_active_jobs() bunları döndürmez.
+        İşareti değişen ilanların `updated_at` alanı ilerler (artımlı export).
+        """
+        from ml.near_duplicates import NearDuplicateDetector, job_completeness
+
+        detector = detector or NearDuplicateDetector()
+        changed_at = changed_at or time.time()
+
+        previous = {job_id: job.pop("duplicate_of", None) for job_id, job in self.jobs.items()}
+
+        active = self.get_active_jobs()
+        duplicates = 0
+
+        for group in detector.find_groups(active):
+            keep = max(group, key=lambda job_id: (
+                job_completeness(self.jobs[job_id]),
+                -self.jobs[job_id].get("first_seen_at", 0)
+            ))
+            for job_id in group:
+                if job_id != keep:
+                    self.jobs[job_id]["duplicate_of"] = keep
+                    duplicates += 1
+
+        for job_id, job in self.jobs.items():
+            if job.get("duplicate_of") != previous[job_id]:
+                job["updated_at"] = changed_at
+
+        # Facet sayaçları yalnızca tekil ilanları saysın
+        for job in self.jobs.values():
+            if job["id"] in self._active_ids and not job.get("duplicate_of"):
+                self.facets.add(job)
+            else:
+                self.facets.remove(job["id"])
+
+        return duplicates
+
+    def expire_jobs(self, job_ids: List[str], expired_at: float = None) -> int:
+        """İlanları pasif yap (silinmez, is_active=False)"""
+
+        expired_at = expired_at or time.time()
+        count = 0
+
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if job and job.get("is_active", True):
+                job["is_active"] = False
+                job["expired_at"] = expired_at
+                job["updated_at"] = expired_at
+                self._active_ids.discard(job_id)
+                self.facets.remove(job_id)
+                count += 1
+
+        return count
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Tek ilanı getir"""
+        return self.jobs.get(job_id)
+
+    def get_all_jobs(self) -> List[Dict]:
+        """Tüm ilanları listele"""
+        return list(self.jobs.values())
+
+    def get_active_jobs(self, include_duplicates: bool = False) -> List[Dict]:
+        """Yalnızca aktif ilanları listele (varsayılan: tekrarlar hariç)"""
+        return [
+            job for job_id, job in self.jobs.items()
+            if job_id in self._active_ids
+            and (include_duplicates or not job.get("duplicate_of"))
+        ]
+
+    def iter_jobs(self, active_only: bool = True, include_duplicates: bool = False) -> Iterator[Dict]:
+        """İlanları kopya liste kurmadan sırayla üret (akış halinde export için)"""
+        for job_id in list(self.jobs):
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            if active_only and job_id not in self._active_ids:
+                continue
+            if not include_duplicates and job.get("duplicate_of"):
+                continue
+            yield job
+
+    def partitions_since(self, since_day: str) -> List[str]:
+        """since_day (dahil) ve sonrasındaki bölüm günleri"""
+        start = bisect.bisect_left(self._partition_days, since_day)
+        return self._partition_days[start:]
+
+    def get_jobs(self, date_posted: str = "all", active_only: bool = True,
+                 include_duplicates: bool = False, now: float = None) -> List[Dict]:
+        """Tarih penceresindeki ilanlar (today, 3days, week, month, all)
+
+        Yalnızca pencereye düşen gün bölümleri okunur; sonuç en yeniden eskiye sıralıdır.
+        """
+
+        days = DATE_POSTED_DAYS.get(date_posted)
+        if days:
+            cutoff = (now or time.time()) - days * 86400
+            since_day = datetime.fromtimestamp(cutoff, tz=timezone.utc).strftime("%Y-%m-%d")
+            partition_days = self.partitions_since(since_day)
+        else:
+            cutoff = None
+            partition_days = self._partition_days
+
+        jobs = []
+        for day in reversed(partition_days):
+            day_ids = sorted(
+                self._partitions[day],
+                key=lambda job_id: (-(self.jobs[job_id].get("posted_timestamp") or 0), job_id)
+            )
+            for job_id in day_ids:
+                if active_only and job_id not in self._active_ids:
+                    continue
+                job = self.jobs[job_id]
+                if not include_duplicates and job.get("duplicate_of"):
+                    continue
+                # Sınır gününde saat hassasiyetinde kes
+                if cutoff and job.get("posted_timestamp") and job["posted_timestamp"] < cutoff:
+                    continue
+                jobs.append(job)
+
+        return jobs
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Dict
+
+# date_posted parametresinin gün karşılığı
+DATE_POSTED_DAYS = {"today": 1, "3days": 3, "week": 7, "month": 30}
+
+
+def format_raw_job(raw_job: Dict) -> Dict:
+    """JSearch ham ilanını ortak ilan şemasına çevir (ham veri eklenmez)"""
+
+    return {
+        "id": raw_job.get("job_id", ""),
+        "title": raw_job.get("job_title", ""),
+        "company": raw_job.get("employer_name", ""),
+        "location": raw_job.get("job_city", "") or raw_job.get("job_country", ""),
+        "city": raw_job.get("job_city", ""),
+        "state": raw_job.get("job_state", ""),
+        "country": raw_job.get("job_country", ""),
+        "latitude": raw_job.get("job_latitude"),
+        "longitude": raw_job.get("job_longitude"),
+        "description": raw_job.get("job_description", ""),
+        "employment_type": raw_job.get("job_employment_type", ""),
+        "posted_date": raw_job.get("job_posted_at_datetime_utc", ""),
+        "posted_timestamp": raw_job.get("job_posted_at_timestamp"),
+        "salary": {
+            "min": raw_job.get("job_min_salary"),
+            "max": raw_job.get("job_max_salary"),
+            "currency": raw_job.get("job_salary_currency", "USD"),
+            "period": raw_job.get("job_salary_period")
+        },
+        "required_skills": raw_job.get("job_required_skills", []),
+        "apply_link": raw_job.get("job_apply_link", ""),
+        "is_remote": raw_job.get("job_is_remote", False),
+        "job_google_link": raw_job.get("job_google_link", "")
+    }
+
+
+def local_to_jsearch(job: Dict) -> Dict:
+    """data/jobs.json kaydını JSearch ham ilan şekline çevir"""
+
+    posted = datetime.strptime(job["posted_date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    location = job.get("location") or {}
+
+    return {
+        "job_id": job["id"],
+        "job_title": job.get("title", ""),
+        "employer_name": job.get("company", ""),
+        "job_description": job.get("description", ""),
+        "job_city": job.get("city", ""),
+        "job_state": job.get("district", ""),
+        "job_country": "TR",
+        "job_latitude": location.get("lat"),
+        "job_longitude": location.get("lon"),
+        "job_employment_type": "PARTTIME" if job.get("duration") == "Sürekli" else "CONTRACTOR",
+        "job_posted_at_datetime_utc": posted.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "job_posted_at_timestamp": int(posted.timestamp()),
+        "job_min_salary": job.get("hourly_wage"),
+        "job_max_salary": job.get("hourly_wage"),
+        "job_salary_currency": "TRY",
+        "job_salary_period": "HOUR",
+        "job_required_skills": job.get("required_skills", []),
+        "job_is_remote": False,
+        "job_apply_link": "",
+        "job_google_link": ""
+    }
+
+
+def normalize_job(job: Dict) -> Dict:
+    """Herhangi bir kaynaktan gelen ilanı ortak şemaya getir
+
+    - JSearch ham ilanı (job_id, job_latitude, job_min_salary...)
+    - data/jobs.json kaydı (hourly_wage, location sözlüğü, category...)
+    - Zaten düzenlenmiş ilan (JSearchClient._format_job çıktısı)
+    """
+
+    if "job_id" in job:
+        normalized = format_raw_job(job)
+        normalized["source_schema"] = "jsearch"
+
+    elif "hourly_wage" in job or isinstance(job.get("location"), dict):
+        normalized = format_raw_job(local_to_jsearch(job))
+        normalized.update({
+            "location": job.get("city", ""),
+            "category": job.get("category", ""),
+            "district": job.get("district", ""),
+            "working_hours": job.get("working_hours", ""),
+            "start_date": job.get("start_date", ""),
+            "is_active": job.get("is_active", True),
+            "source_schema": "local"
+        })
+
+    else:
+        normalized = {k: v for k, v in job.items() if k != "raw_data"}
+        normalized.setdefault("source_schema", "jsearch")
+
+    return normalized
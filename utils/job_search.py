@@ -0,0 +1,213 @@
+import bisect
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.api_client import JSearchClient
+from utils.job_schema import DATE_POSTED_DAYS
+from utils.text import fold, tokenize
+
+# Alan ağırlıkları: başlıkta geçen terim açıklamada geçenden değerlidir
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "category": 2.0,
+    "company": 1.5,
+    "description": 1.0,
+}
+
+# "Turkey in ..." gibi ülke geneli konumlar şehir filtresi sayılmaz
+COUNTRY_NAMES = {"turkey", "turkiye", "tr"}
+
+
+def city_filter_from_location(location: str) -> Optional[str]:
+    """Serbest konum metninden şehir filtresi çıkar ("Istanbul, Turkey" -> "istanbul")"""
+
+    city = fold((location or "").split(",")[0]).strip()
+    return None if not city or city in COUNTRY_NAMES else city
+
+
+class JobSearchIndex:
+    """Yerel katalog üzerinde BM25 tam metin arama
+
+    Türkçe harf katlamalı tokenizer (utils/text.py) ile başlık, açıklama,
+    kategori ve şirket alanları ağırlıklı olarak indekslenir. Şehir,
+    çalışma tipi ve remote filtreleri önceden hesaplanmış id kümeleridir.
+    """
+
+    def __init__(self, jobs: List[Dict], k1: float = 1.5, b: float = 0.75):
+        self.jobs = list(jobs)
+        self.k1 = k1
+        self.b = b
+
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)  # terim -> {doc: ağırlıklı tf}
+        self.doc_lengths: List[float] = []
+        self.by_city: Dict[str, set] = defaultdict(set)
+        self.by_employment_type: Dict[str, set] = defaultdict(set)
+        self.remote_docs: set = set()
+
+        for doc, job in enumerate(self.jobs):
+            weighted_tf = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(job.get(field) or ""):
+                    weighted_tf[token] += weight
+
+            for token, tf in weighted_tf.items():
+                self.postings[token][doc] = tf
+            self.doc_lengths.append(sum(weighted_tf.values()))
+
+            city = fold(job.get("city") or job.get("location") or "")
+            if city:
+                self.by_city[city].add(doc)
+            if job.get("employment_type"):
+                self.by_employment_type[job["employment_type"].upper()].add(doc)
+            if job.get("is_remote"):
+                self.remote_docs.add(doc)
+
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+
+        # Zaman filtresi tüm ilanları taramasın: yayın zamanına göre sıralı dizin
+        by_time = sorted((job.get("posted_timestamp") or 0, doc) for doc, job in enumerate(self.jobs))
+        self._timestamps = [ts for ts, _ in by_time]
+        self._docs_by_time = [doc for _, doc in by_time]
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def _idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.jobs) - df + 0.5) / (df + 0.5))
+
+    def _allowed_docs(self, city=None, employment_type=None, remote=None,
+                      posted_after=None) -> Optional[set]:
+        """Filtrelere uyan doküman kümesi (filtre yoksa None)"""
+
+        allowed = None
+
+        def narrow(docs):
+            nonlocal allowed
+            allowed = set(docs) if allowed is None else allowed & docs
+
+        if city:
+            narrow(self.by_city.get(fold(city), set()))
+        if employment_type:
+            narrow(self.by_employment_type.get(employment_type.upper(), set()))
+        if remote is not None:
+            narrow(self.remote_docs if remote else set(range(len(self.jobs))) - self.remote_docs)
+        if posted_after:
+            start = bisect.bisect_left(self._timestamps, posted_after)
+            narrow(set(self._docs_by_time[start:]))
+
+        return allowed
+
+    def search(self, query: str, city: str = None, employment_type: str = None,
+               remote: bool = None, posted_after: float = None,
+               top_n: int = 20) -> List[Dict]:
+        """Sorguya en uygun ilanları [{'job', 'score'}] olarak döndür"""
+
+        allowed = self._allowed_docs(city, employment_type, remote, posted_after)
+        terms = set(tokenize(query))
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            idf = self._idf(term)
+            for doc, tf in postings.items():
+                if allowed is not None and doc not in allowed:
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc] / self.avg_length)
+                scores[doc] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        if not terms:
+            # Boş sorgu: filtreye uyanlar en yeniden eskiye
+            docs = allowed if allowed is not None else range(len(self.jobs))
+            ranked = sorted(docs, key=lambda d: self.jobs[d].get("posted_timestamp") or 0, reverse=True)
+            return [{"job": self.jobs[d], "score": 0.0} for d in ranked[:top_n]]
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [{"job": self.jobs[doc], "score": round(score, 3)} for doc, score in ranked[:top_n]]
+
+
+class LocalFirstSearch:
+    """Önce yerel indekste ara, sonuç azsa JSearchClient'a düş"""
+
+    def __init__(self, index: JobSearchIndex, client: JSearchClient, min_results: int = 5):
+        self.index = index
+        self.client = client
+        self.min_results = min_results
+
+    def search(self, query: str, location: str = "Turkey", date_posted: str = "all",
+               employment_type: str = None, remote: bool = None, num_pages: int = 1,
+               top_n: int = 50, on_job: Callable[[List[Dict]], None] = None,
+               cancel: threading.Event = None, throttled: List[int] = None) -> Tuple[List[Dict], str]:
+        """(ilanlar, kaynak) döndür; kaynak "local" veya "local+api"
+
+        on_job verilirse API'den her ilan geldiğinde o ana kadarki liste ile çağrılır.
+        cancel işaretlenirse kalan API sayfaları beklenmez, o ana kadarkiler döner.
+        Hız sınırına takılan API sayfaları `throttled` listesine eklenir.
+        """
+
+        days = DATE_POSTED_DAYS.get(date_posted)
+        posted_after = time.time() - days * 86400 if days else None
+
+        local = [
+            result["job"] for result in self.index.search(
+                query,
+                city=city_filter_from_location(location),
+                employment_type=employment_type,
+                remote=remote,
+                posted_after=posted_after,
+                top_n=top_n
+            )
+        ]
+
+        if len(local) >= self.min_results:
+            return local, "local"
+
+        jobs = list(local)
+        seen = {job["id"] for job in jobs}
+        for job in self.client.search_jobs_stream(
+            query=query,
+            location=location,
+            num_pages=num_pages,
+            date_posted=date_posted,
+            throttled=throttled
+        ):
+            if cancel is not None and cancel.is_set():
+                break
+            if job["id"] in seen:
+                continue
+            if remote is not None and bool(job.get("is_remote")) != remote:
+                continue
+            if employment_type and (job.get("employment_type") or "").upper() != employment_type.upper():
+                continue
+            seen.add(job["id"])
+            jobs.append(job)
+            if on_job:
+                on_job(jobs)
+
+        return jobs, "local+api"
+
+
+# Test
+if __name__ == "__main__":
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog("/tmp/jobmatch_catalog_test.json")
+    catalog.ingest_local_file("data/jobs.json")
+
+    start = time.perf_counter()
+    index = JobSearchIndex(catalog.get_active_jobs())
+    print(f"📚 {len(index)} ilan indekslendi ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    for query, city in [("kurye", "İstanbul"), ("veri girisi", None), ("ÇEVİRİ", "ankara")]:
+        start = time.perf_counter()
+        results = index.search(query, city=city, top_n=3)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n🔍 '{query}' ({city or 'tüm şehirler'}) - {elapsed:.2f} ms")
+        for result in results:
+            print(f"   {result['score']:.2f}  {result['job']['title']} / {result['job']['city']}")
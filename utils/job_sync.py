@@ -0,0 +1,187 @@
+import json
+import os
+import time
+from typing import Dict, List
+
+import requests
+
+from utils.api_client import JSearchClient
+from utils.job_catalog import JobCatalog
+from utils.rate_limit import RateLimitExceeded
+
+# Son senkronizasyondan bu yana geçen süreyi kapsayan en dar date_posted penceresi
+SYNC_WINDOWS = [
+    (86400, "today"),
+    (3 * 86400, "3days"),
+    (7 * 86400, "week"),
+    (30 * 86400, "month"),
+]
+
+
+class JobSync:
+    """Takip edilen sorgular için artımlı (watermark'lı) katalog senkronizasyonu
+
+    Her sorgu için görülen en yeni `posted_timestamp` (watermark) ve son
+    senkronizasyon zamanı saklanır. Sonraki turlarda yalnızca aradaki
+    süreyi kapsayan pencere (çoğunlukla today/3days) istenir ve yeni ilanlar
+    kataloğa eklenir. Pencere içinde kalıp artık dönmeyen veya
+    `expire_after_days` boyunca görülmeyen ilanlar pasif yapılır.
+    """
+
+    def __init__(self, client: JSearchClient, catalog: JobCatalog,
+                 state_file="data/sync_state.json", num_pages=1, expire_after_days=14):
+        self.client = client
+        self.catalog = catalog
+        self.state_file = state_file
+        self.num_pages = num_pages
+        self.expire_after = expire_after_days * 86400
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Watermark durumunu dosyadan yükle"""
+        if os.path.exists(self.state_file):
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {"queries": {}}
+
+    def _save_state(self):
+        """Watermark durumunu dosyaya kaydet"""
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _key(query: str, location: str) -> str:
+        return f"{query}|{location}"
+
+    def track(self, query: str, location: str = "Turkey"):
+        """Sorguyu senkronizasyon listesine ekle"""
+
+        key = self._key(query, location)
+        if key not in self.state["queries"]:
+            self.state["queries"][key] = {
+                "query": query,
+                "location": location,
+                "watermark": 0,
+                "last_sync": None
+            }
+            self._save_state()
+
+    def _window(self, last_sync) -> str:
+        """Son senkronizasyondan bu yana geçen süreye uygun pencere"""
+
+        if not last_sync:
+            return "month"  # İlk senkronizasyon: bir aylık geri doldurma
+
+        elapsed = time.time() - last_sync
+        for seconds, window in SYNC_WINDOWS:
+            if elapsed <= seconds:
+                return window
+        return "all"
+
+    def sync_query(self, query: str, location: str = "Turkey") -> Dict:
+        """Tek sorguyu senkronize et ve özet döndür"""
+
+        self.track(query, location)
+        key = self._key(query, location)
+        entry = self.state["queries"][key]
+        window = self._window(entry["last_sync"])
+        now = time.time()
+
+        try:
+            # Önbellek atlanır; hata olursa last_sync ve watermark ilerlemez,
+            # bir sonraki tur aynı (kaçırılan) pencereyi yeniden ister
+            jobs = self.client.fetch_jobs(
+                query=query,
+                location=location,
+                num_pages=self.num_pages,
+                date_posted=window,
+                refresh=True
+            )
+        except (requests.exceptions.RequestException, RateLimitExceeded) as e:
+            print(f"Senkronizasyon hatası ({key}): {e}")
+            return {"query": key, "window": window, "error": str(e)}
+
+        watermark = entry["watermark"] or 0
+        new_jobs = [
+            job for job in jobs
+            if (job.get("posted_timestamp") or 0) > watermark or job["id"] not in self.catalog.jobs
+        ]
+        added, updated = self.catalog.upsert_jobs(jobs, source=key, seen_at=now)
+
+        # Pencere tam dönmüşse (sayfa limitine takılmamışsa) pencere içinde
+        # olup gelmeyen ilanlar yayından kalkmış demektir
+        expired = 0
+        if jobs and len(jobs) < self.num_pages * 10:
+            window_start = self._window_start(window, now)
+            returned = {job["id"] for job in jobs}
+            missing = [
+                job["id"] for job in self.catalog.get_active_jobs(include_duplicates=True)
+                if key in job.get("sources", [])
+                and job["id"] not in returned
+                and (job.get("posted_timestamp") or 0) >= window_start
+            ]
+            expired = self.catalog.expire_jobs(missing, expired_at=now)
+
+        timestamps = [job["posted_timestamp"] for job in jobs if job.get("posted_timestamp")]
+        entry["watermark"] = max([watermark] + timestamps)
+        entry["last_sync"] = now
+        self._save_state()
+
+        return {
+            "query": key,
+            "window": window,
+            "fetched": len(jobs),
+            "new": len(new_jobs),
+            "added": added,
+            "updated": updated,
+            "expired": expired
+        }
+
+    @staticmethod
+    def _window_start(window: str, now: float) -> float:
+        """Pencerenin başlangıç zamanı"""
+        for seconds, name in SYNC_WINDOWS:
+            if name == window:
+                return now - seconds
+        return 0
+
+    def expire_stale(self) -> int:
+        """Uzun süredir hiçbir senkronizasyonda görülmeyen ilanları pasif yap"""
+
+        cutoff = time.time() - self.expire_after
+        stale = [
+            job["id"] for job in self.catalog.get_active_jobs(include_duplicates=True)
+            if job.get("sources")
+            and max(job.get("posted_timestamp") or 0, job.get("last_seen_at") or 0) < cutoff
+        ]
+        return self.catalog.expire_jobs(stale)
+
+    def sync_all(self) -> List[Dict]:
+        """Takip edilen tüm sorguları senkronize et ve kataloğu kaydet"""
+
+        results = []
+        for entry in list(self.state["queries"].values()):
+            results.append(self.sync_query(entry["query"], entry["location"]))
+
+        expired = self.expire_stale()
+        if expired:
+            results.append({"query": "*", "expired": expired})
+
+        self.catalog.dedupe()
+        self.catalog.save()
+        return results
+
+
+# Test
+if __name__ == "__main__":
+    catalog = JobCatalog()
+    sync = JobSync(JSearchClient(), catalog)
+
+    for query in ["part time", "internship", "stajyer"]:
+        sync.track(query, "Istanbul, Turkey")
+
+    for result in sync.sync_all():
+        print(result)
+
+    print(f"\n📦 Katalogda {len(catalog.get_active_jobs())} aktif ilan var")
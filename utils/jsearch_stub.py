@@ -0,0 +1,217 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+from utils.job_schema import DATE_POSTED_DAYS, local_to_jsearch
+from utils.text import fold, tokenize
+
+
+class JSearchStubServer:
+    """JSearch /search uç noktasını taklit eden yerel HTTP sunucu
+
+    data/jobs.json'dan JSearch şeklinde yanıt üretir. Gecikme, 5xx hata
+    oranı ve saniye başı istek limiti (aşılırsa 429) ayarlanabilir; böylece
+    JSearchClient ağa çıkmadan yük ve hata senaryolarında ölçülebilir.
+    """
+
+    def __init__(self, jobs_file="data/jobs.json", host="127.0.0.1", port=0,
+                 latency=0.05, jitter=0.02, error_rate=0.0, rate_limit=None,
+                 page_size=10, seed=42):
+        with open(jobs_file, 'r', encoding='utf-8') as f:
+            self.jobs = [local_to_jsearch(job) for job in json.load(f)]
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit  # saniyede izin verilen istek, None: sınırsız
+        self.page_size = page_size
+        self.random = random.Random(seed)
+
+        # Tarih filtresi verideki en yeni ilana göre çalışır (veri sabit olduğu için)
+        self.reference_time = max(job["job_posted_at_timestamp"] for job in self.jobs) + 86400
+
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0}
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Sunucunun temel adresi (JSearchClient base_url için)"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Sunucuyu durdur"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _throttled(self) -> bool:
+        """Sabit 1 sn pencerede istek limitini aştık mı"""
+
+        if not self.rate_limit:
+            return False
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count > self.rate_limit
+
+    def search(self, params: Dict) -> List[Dict]:
+        """Sorguya uyan ilanları sayfalanmış olarak döndür"""
+
+        query = params.get("query", "")
+        terms, _, location = query.rpartition(" in ")
+        if not terms:
+            terms, location = location, ""
+
+        query_tokens = set(tokenize(terms))
+        location_tokens = set(tokenize(location)) - {"turkey", "turkiye"}
+
+        days = DATE_POSTED_DAYS.get(params.get("date_posted", "all"))
+        min_timestamp = self.reference_time - days * 86400 if days else 0
+
+        candidates = [
+            job for job in self.jobs
+            if job["job_posted_at_timestamp"] >= min_timestamp
+            and (not location_tokens or fold(job["job_city"]) in location_tokens)
+        ]
+
+        matched = [
+            job for job in candidates
+            if query_tokens & set(tokenize(f"{job['job_title']} {job['job_description']}"))
+        ]
+        # Hiçbir terim eşleşmezse geniş eşleşme: konumdaki tüm ilanlar
+        results = matched or candidates
+
+        page = max(1, int(params.get("page", 1)))
+        num_pages = max(1, int(params.get("num_pages", 1)))
+        start = (page - 1) * self.page_size
+        return results[start:start + num_pages * self.page_size]
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass  # Yük testinde konsolu doldurmasın
+
+            def _send(self, status: int, body: Dict, headers: Dict = None):
+                payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+                with stub._lock:
+                    stub.stats["requests"] += 1
+                    fail = stub.random.random() < stub.error_rate
+                    delay = max(0.0, stub.latency + stub.random.uniform(-stub.jitter, stub.jitter))
+
+                if url.path != "/search":
+                    self._send(404, {"status": "ERROR", "message": "Not found"})
+                    return
+
+                if stub._throttled():
+                    with stub._lock:
+                        stub.stats["throttled"] += 1
+                    self._send(429, {"message": "Too many requests"}, {"Retry-After": "1"})
+                    return
+
+                time.sleep(delay)
+
+                if fail:
+                    with stub._lock:
+                        stub.stats["errors"] += 1
+                    self._send(503, {"status": "ERROR", "message": "Service unavailable"})
+                    return
+
+                self._send(200, {
+                    "status": "OK",
+                    "parameters": params,
+                    "data": stub.search(params)
+                })
+
+        return Handler
+
+
+def run_benchmark(requests_count=50, workers=8, latency=0.05, error_rate=0.1,
+                  rate_limit=None, max_retries=2, cache_ttl=0):
+    """Sahte sunucuya karşı JSearchClient verimini ölç (cache_ttl=0: önbelleksiz)"""
+
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.api_client import JSearchClient
+    from utils.rate_limit import RateLimitExceeded, TokenBucket
+    from utils.response_cache import TTLCache
+
+    with JSearchStubServer(latency=latency, error_rate=error_rate, rate_limit=rate_limit) as stub:
+        client = JSearchClient(
+            base_url=stub.url,
+            limiter=TokenBucket(rate=1000, capacity=1000),
+            max_retries=max_retries,
+            cache=TTLCache(ttl=cache_ttl)
+        )
+        queries = ["garson", "kurye", "veri girişi", "çeviri", "grafik tasarım"]
+        cities = ["Istanbul", "Ankara", "Izmir", "Bursa", "Antalya"]
+
+        outcome = {"ok": 0, "empty": 0, "rate_limited": 0}
+
+        def one(i):
+            try:
+                jobs = client.search_jobs(
+                    query=queries[i % len(queries)],
+                    location=cities[(i // len(queries)) % len(cities)],
+                    date_posted="all"
+                )
+                return "ok" if jobs else "empty"
+            except RateLimitExceeded:
+                return "rate_limited"
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(one, range(requests_count)):
+                outcome[result] += 1
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests_count / elapsed, 1),
+        "client": outcome,
+        "server": stub.stats
+    }
+
+
+# Test
+if __name__ == "__main__":
+    print("🧪 Sahte JSearch sunucusuna karşı benchmark...")
+    print(json.dumps(run_benchmark(), indent=2, ensure_ascii=False))
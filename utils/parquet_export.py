@@ -0,0 +1,179 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Kullanıcı tablosu: listeler liste kolonu, sayılar boş bırakılabilir
+USER_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("name", pa.string()),
+    ("email", pa.string()),
+    ("created_at", pa.timestamp("us")),
+    ("age", pa.int32()),
+    ("city", pa.string()),
+    ("district", pa.string()),
+    ("university", pa.string()),
+    ("skills", pa.list_(pa.string())),
+    ("education_level", pa.string()),
+    ("department", pa.string()),
+    ("gpa", pa.float64()),
+    ("min_hourly_wage", pa.float64()),
+    ("max_distance_km", pa.float64()),
+    ("preferred_job_types", pa.list_(pa.string())),
+    ("remote_preference", pa.string()),
+    ("experience_months", pa.int32()),
+    ("total_applications", pa.int32()),
+])
+
+# İlan tablosu: açıklama kısaltılmadan, yayın zamanı UTC timestamp olarak
+JOB_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("title", pa.string()),
+    ("company", pa.string()),
+    ("location", pa.string()),
+    ("city", pa.string()),
+    ("state", pa.string()),
+    ("country", pa.string()),
+    ("employment_type", pa.string()),
+    ("is_remote", pa.bool_()),
+    ("posted_at", pa.timestamp("ms", tz="UTC")),
+    ("salary_min", pa.float64()),
+    ("salary_max", pa.float64()),
+    ("salary_currency", pa.string()),
+    ("salary_period", pa.string()),
+    ("required_skills", pa.list_(pa.string())),
+    ("apply_link", pa.string()),
+    ("description", pa.string()),
+    ("is_active", pa.bool_()),
+    ("duplicate_of", pa.string()),
+])
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """ISO metni veya epoch saniyesini datetime'a çevir (okunamazsa None)"""
+
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return None if value in (None, "") else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _integer(value) -> Optional[int]:
+    number = _number(value)
+    return None if number is None else int(number)
+
+
+def user_record(user: Dict) -> Dict:
+    """Kullanıcıyı USER_SCHEMA satırına çevir"""
+
+    profile = user.get("profile") or {}
+    created_at = _timestamp(user.get("created_at"))
+
+    return {
+        "id": user.get("id"),
+        "name": user.get("name"),
+        "email": user.get("email"),
+        "created_at": created_at.replace(tzinfo=None) if created_at else None,
+        "age": _integer(profile.get("age")),
+        "city": profile.get("city"),
+        "district": profile.get("district"),
+        "university": profile.get("university"),
+        "skills": list(profile.get("skills") or []),
+        "education_level": profile.get("education_level"),
+        "department": profile.get("department"),
+        "gpa": _number(profile.get("gpa")),
+        "min_hourly_wage": _number(profile.get("min_hourly_wage")),
+        "max_distance_km": _number(profile.get("max_distance_km")),
+        "preferred_job_types": list(profile.get("preferred_job_types") or []),
+        "remote_preference": profile.get("remote_preference"),
+        "experience_months": _integer(profile.get("experience_months")),
+        "total_applications": len(user.get("application_history") or []),
+    }
+
+
+def job_record(job: Dict) -> Dict:
+    """İlanı JOB_SCHEMA satırına çevir"""
+
+    salary = job.get("salary") or {}
+
+    return {
+        "id": job.get("id"),
+        "title": job.get("title"),
+        "company": job.get("company"),
+        "location": job.get("location"),
+        "city": job.get("city") or job.get("job_city"),
+        "state": job.get("state") or job.get("job_state") or job.get("district"),
+        "country": job.get("country") or job.get("job_country"),
+        "employment_type": job.get("employment_type"),
+        "is_remote": bool(job.get("is_remote")),
+        "posted_at": _timestamp(job.get("posted_timestamp") or job.get("posted_date")),
+        "salary_min": _number(salary.get("min")),
+        "salary_max": _number(salary.get("max")),
+        "salary_currency": salary.get("currency"),
+        "salary_period": salary.get("period"),
+        "required_skills": list(job.get("required_skills") or []),
+        "apply_link": job.get("apply_link"),
+        "description": job.get("description"),
+        "is_active": bool(job.get("is_active", True)),
+        "duplicate_of": job.get("duplicate_of"),
+    }
+
+
+def write_parquet(records: Iterable[Dict], schema: pa.Schema, sink,
+                  row_group_size: int = 50_000, compression: str = "zstd") -> int:
+    """Kayıtları row group'lar halinde Parquet'e yaz, satır sayısını döndür
+
+    sink bir dosya yolu veya yazılabilir dosya nesnesi olabilir. Bellekte
+    aynı anda en fazla bir row group bulunur.
+    """
+
+    total = 0
+    batch = []
+
+    with pq.ParquetWriter(sink, schema, compression=compression) as writer:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= row_group_size:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                total += len(batch)
+                batch = []
+
+        if batch or total == 0:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            total += len(batch)
+
+    return total
+
+
+# Test
+if __name__ == "__main__":
+    import io
+    import time
+
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog("/tmp/jobmatch_catalog_test.json")
+    catalog.ingest_local_file("data/jobs.json")
+
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    rows = write_parquet((job_record(job) for job in catalog.iter_jobs()), JOB_SCHEMA, buffer, row_group_size=32)
+    print(f"📦 {rows} ilan Parquet'e yazıldı: {len(buffer.getvalue()) / 1024:.1f} KB "
+          f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    buffer.seek(0)
+    parquet_file = pq.ParquetFile(buffer)
+    print(f"🧱 Row group sayısı: {parquet_file.num_row_groups}")
+    print(parquet_file.schema_arrow)
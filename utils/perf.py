@@ -0,0 +1,124 @@
+import ast
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+# Giriş sayfasında yüklenmemesi gereken ağır kütüphaneler
+HEAVY_MODULES = ["pandas", "sklearn", "matplotlib"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def app_imports(script: str = "app.py") -> List[str]:
+    """Betiğin modül seviyesinde import ettiği proje modülleri (utils.*, ml.*)
+
+    Elle tutulan liste app.py'ye eklenen import'ları kaçırıyordu; liste
+    her ölçümde kaynaktan çıkarılır. Fonksiyon içindeki (tembel) import'lar
+    giriş sayfasında yüklenmediği için sayılmaz.
+    """
+
+    with open(os.path.join(_ROOT, script), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        modules += [name for name in names
+                    if name.split(".")[0] in ("utils", "ml") and name not in modules]
+    return modules
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Temiz bir Python sürecinde kod çalıştır (önbellekli import'lar ölçümü bozmasın)"""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=_ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def measure_imports(modules: List[str] = None) -> Dict:
+    """Modüllerin soğuk import süresi ve yüklenen ağır kütüphaneler"""
+
+    modules = modules or app_imports()
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modules) +
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'import_ms': round(elapsed, 1), 'heavy_loaded': heavy}))\n"
+    )
+    result = _run_python(code, "-X", "importtime")
+
+    # -X importtime çıktısı: "import time: self | cumulative | paket"
+    slowest = []
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.replace("import time:", "").split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            slowest.append((int(parts[1]), parts[2]))
+    slowest.sort(reverse=True)
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report["slowest"] = [
+        {"module": name.strip(), "cumulative_ms": round(us / 1000, 1)}
+        for us, name in slowest[:10]
+    ]
+    return report
+
+
+def measure_first_run(script: str = "app.py") -> Dict:
+    """Streamlit betiğinin ilk çalıştırma (giriş sayfası) süresi"""
+
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = AppTest.from_file({os.path.join(_ROOT, script)!r}, default_timeout=120)\n"
+        "at.run()\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'first_run_ms': round(elapsed, 1), 'heavy_loaded': heavy,"
+        " 'errors': len(at.exception)}))\n"
+    )
+    result = _run_python(code)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def cold_start_report(budget_ms: float = None) -> Dict:
+    """İmport ve ilk çalıştırma ölçümlerini birleştir, bütçe aşımını işaretle"""
+
+    report = {
+        "imports": measure_imports(),
+        "first_run": measure_first_run(),
+    }
+
+    problems = []
+    if report["first_run"]["heavy_loaded"]:
+        problems.append(f"Giriş sayfasında ağır modül yüklendi: {report['first_run']['heavy_loaded']}")
+    if report["first_run"]["errors"]:
+        problems.append("İlk çalıştırmada hata oluştu")
+    if budget_ms and report["first_run"]["first_run_ms"] > budget_ms:
+        problems.append(f"İlk çalıştırma {budget_ms} ms bütçesini aştı")
+
+    report["problems"] = problems
+    return report
+
+
+# Test
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else None
+
+    report = cold_start_report(budget)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+    if report["problems"]:
+        print("\n❌ " + "\n❌ ".join(report["problems"]))
+        sys.exit(1)
+    print("\n✅ Soğuk başlangıç bütçe içinde")
@@ -0,0 +1,114 @@
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import requests
+
+from utils.api_client import JSearchClient
+from utils.rate_limit import RateLimitExceeded
+
+
+class PrefetchScheduler:
+    """Popüler aramaları arka planda tazeleyen zamanlayıcı
+
+    JSearchClient.search_jobs çağrılarından (sorgu, konum, date_posted)
+    sıklığını sayar; en popüler top_k aramanın önbellek kaydı
+    `refresh_after` saniyeden eskiyse arka planda yeniler. Yenileme
+    çağrıları saatlik kotaya (`calls_per_hour`) sığacak şekilde aralıklı
+    yapılır, böylece kullanıcı aramalarının çoğu önbellekten sıcak döner.
+    """
+
+    def __init__(self, client: JSearchClient, top_k: int = 10, calls_per_hour: int = 60,
+                 refresh_after: float = 1800, cycle_seconds: float = 60, decay: float = 0.9):
+        self.client = client
+        self.top_k = top_k
+        self.call_interval = 3600 / calls_per_hour
+        self.refresh_after = refresh_after
+        self.cycle_seconds = cycle_seconds
+        self.decay = decay  # Her turda sayaçlar azalır, eski popülerlik söner
+
+        self.counts: Counter = Counter()
+        self.request_shapes: Dict[Tuple, List[Dict]] = {}  # arama -> gönderilen istek parametreleri
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, query, location, date_posted, params_list: List[Dict]):
+        """Bir kullanıcı aramasını say (JSearchClient dinleyicisi)"""
+
+        key = (query, location, date_posted)
+        with self._lock:
+            self.counts[key] += 1
+            self.request_shapes[key] = params_list
+
+    def top_searches(self) -> List[Tuple]:
+        """En sık yapılan top_k arama"""
+        with self._lock:
+            return [key for key, _ in self.counts.most_common(self.top_k)]
+
+    def due_requests(self) -> List[Dict]:
+        """Popüler aramalardan önbelleği bayatlamış istekler"""
+
+        due = []
+        for key in self.top_searches():
+            for params in self.request_shapes.get(key, []):
+                age = self.client.cache_age(params)
+                if age is None or age >= self.refresh_after:
+                    due.append(params)
+        return due
+
+    def run_once(self) -> int:
+        """Bir tur yenileme yap, yapılan istek sayısını döndür"""
+
+        refreshed = 0
+        for params in self.due_requests():
+            if self._stop.is_set():
+                break
+
+            try:
+                self.client.refresh(params)
+                refreshed += 1
+            except RateLimitExceeded:
+                break  # Bütçe kullanıcı aramalarına kalsın
+            except requests.exceptions.RequestException as e:
+                print(f"Ön-yükleme hatası: {e}")
+
+            # Kotaya sığmak için çağrılar arasında bekle
+            self._stop.wait(self.call_interval)
+
+        with self._lock:
+            for key in list(self.counts):
+                self.counts[key] *= self.decay
+                if self.counts[key] < 0.1:
+                    del self.counts[key]
+                    self.request_shapes.pop(key, None)
+
+        return refreshed
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:  # Beklenmedik hata thread'i öldürmesin, sonraki turda tekrar denenir
+                print(f"Ön-yükleme zamanlayıcısı hatası: {e}")
+            self._stop.wait(self.cycle_seconds)
+
+    def start(self):
+        """Arama takibini ve arka plan thread'ini başlat"""
+
+        if self.record not in JSearchClient.search_listeners:
+            JSearchClient.search_listeners.append(self.record)
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, daemon=True, name="jsearch-prefetch")
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Zamanlayıcıyı durdur"""
+
+        self._stop.set()
+        if self.record in JSearchClient.search_listeners:
+            JSearchClient.search_listeners.remove(self.record)
@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable
+
+
+class RateLimitExceeded(Exception):
+    """İstek bütçesi tükendiğinde fırlatılır (geri basınç sinyali)"""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"İstek limiti aşıldı, {retry_after:.1f} sn sonra tekrar deneyin")
+
+
+class TokenBucket:
+    """Thread-safe token bucket hız sınırlayıcı
+
+    Saniyede `rate` token dolar, en fazla `capacity` token birikir.
+    Token yoksa istek sıraya girer (token borç alınır); bekleme süresi
+    `max_wait` değerini aşacaksa RateLimitExceeded fırlatılır.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Geçen süreye göre token ekle"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, max_wait: float = None) -> float:
+        """Bir token ayır ve beklenmesi gereken süreyi döndür"""
+
+        with self.lock:
+            self._refill(time.monotonic())
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+
+            wait = (1 - self.tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitExceeded(wait)
+
+            # Token'ı önceden ayır: sonraki çağıranlar bunun arkasında sıraya girer
+            self.tokens -= 1
+            return wait
+
+    def acquire(self, max_wait: float = None):
+        """Token alınana kadar bekle"""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class SingleFlight:
+    """Aynı anahtarla eşzamanlı çağrıları tek bir çağrıda birleştir
+
+    İlk gelen çağrı işi yapar; iş sürerken aynı anahtarla gelenler
+    aynı sonucu (veya aynı hatayı) bekler.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable):
+        """fn'i anahtar başına en fazla bir kez eşzamanlı çalıştır"""
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from utils.facets import FacetIndex
+
+
+def search_key(**params) -> str:
+    """Arama parametrelerinden paylaşılan önbellek anahtarı"""
+
+    encoded = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class SharedResultCache:
+    """Oturumlar arası paylaşılan, referans sayımlı arama sonucu önbelleği
+
+    Aynı parametrelerle yapılan aramalar tek bir kayıt paylaşır; oturumlar
+    yalnızca anahtarı (handle) ve ilan id listesini tutar. Kayıt başına
+    ilanlar, köken bilgisi ve facet sayaçları bir kez saklanır. Sınır
+    aşıldığında önce hiçbir oturumun kullanmadığı en eski kayıtlar atılır;
+    Streamlit kapanan oturumları bildirmediği için gerekirse kullanımdaki
+    kayıtlar da atılır ve oturum aramayı yeniden yapar.
+    """
+
+    def __init__(self, max_entries: int = 64, max_jobs: int = 20000, ttl: float = 900):
+        self.max_entries = max_entries
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._job_count = 0
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Yeni arama için süresi dolmamış kaydı getir (yoksa None)
+
+        TTL referans sayısından bağımsız uygulanır: kapanan oturumlar
+        referanslarını bırakmadığı için popüler aramalar aksi halde hiç
+        tazelenmezdi. Süresi dolan kayıt kullanımdaysa silinmez; onu tutan
+        oturumlar get() ile okumaya devam eder.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["created_at"] > self.ttl:
+                if entry["refs"] == 0:
+                    self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Oturumun zaten bağlı olduğu kayıt (TTL uygulanmaz; atıldıysa None)"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, jobs: List[Dict], provenance: Dict = None) -> Dict:
+        """Sonuçları kaydet (aynı anahtar varsa içeriği yenilenir, referanslar korunur)"""
+
+        entry = {
+            "jobs": {job["id"]: job for job in jobs},
+            "ids": [job["id"] for job in jobs],
+            "provenance": provenance or {},
+            "facets": FacetIndex(jobs),
+            "created_at": time.time(),
+            "refs": 0,
+        }
+
+        with self._lock:
+            if key in self._entries:
+                entry["refs"] = self._entries[key]["refs"]
+                self._drop(key)
+            self._entries[key] = entry
+            self._job_count += len(entry["ids"])
+            self._evict()
+
+        return entry
+
+    def acquire(self, key: str) -> Optional[Dict]:
+        """Oturum kaydı kullanmaya başladı"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["refs"] += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def release(self, key: str):
+        """Oturum kaydı bıraktı"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["refs"] > 0:
+                entry["refs"] -= 1
+                self._evict()
+
+    def get_jobs(self, key: str, ids: List[str] = None) -> Optional[List[Dict]]:
+        """Kayıttaki ilanlar (ids verilirse o sırayla); kayıt atıldıysa None"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        jobs = entry["jobs"]
+        return [jobs[job_id] for job_id in (entry["ids"] if ids is None else ids) if job_id in jobs]
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key)
+        self._job_count -= len(entry["ids"])
+
+    def _evict(self):
+        """Sınırlar aşıldıysa en eski kayıtları at (kilit altında çağrılır)"""
+
+        def over_limit():
+            return len(self._entries) > self.max_entries or self._job_count > self.max_jobs
+
+        # Önce kullanılmayanlar, hâlâ sınır aşılıyorsa en eskiler
+        for unused_only in (True, False):
+            for key in list(self._entries):
+                if not over_limit() or len(self._entries) == 1:
+                    return
+                if unused_only and self._entries[key]["refs"] > 0:
+                    continue
+                self._drop(key)
+
+    def stats(self) -> Dict:
+        """Kayıt, ilan ve referans sayıları"""
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "jobs": self._job_count,
+                "refs": sum(entry["refs"] for entry in self._entries.values()),
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Test
+if __name__ == "__main__":
+    from utils.job_catalog import JobCatalog
+
+    catalog = JobCatalog("/tmp/jobmatch_catalog_test.json")
+    catalog.ingest_local_file("data/jobs.json")
+    jobs = catalog.get_active_jobs()
+
+    cache = SharedResultCache(max_entries=2)
+    key = search_key(query="kurye", location="Istanbul")
+
+    # 50 oturum aynı aramayı yapar: tek kopya
+    cache.put(key, jobs)
+    for _ in range(50):
+        cache.acquire(key)
+    print(f"👥 50 oturum, {cache.stats()}")
+
+    cache.put(search_key(query="garson"), jobs[:5])
+    cache.put(search_key(query="çeviri"), jobs[:5])
+    print(f"🧹 Sınır aşıldı, kullanımdaki kayıt duruyor mu: {cache.lookup(key) is not None}, {cache.stats()}")
+
+    # Süresi dolan kayıt yeni aramaya verilmez, bağlı oturumlar okumaya devam eder
+    cache.ttl = 0
+    print(f"⌛ TTL doldu: lookup={cache.lookup(key) is not None}, get={cache.get(key) is not None}")
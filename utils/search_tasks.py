@@ -0,0 +1,79 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+
+class SearchTask:
+    """Arka planda çalışan tek bir arama
+
+    İşçi fonksiyonu görevi parametre olarak alır; o ana kadar gelen ilanları
+    `partial` listesine yazar ve `cancelled` işaretlendiyse erkenden döner.
+    Arayüz görevi sorgulayarak ara ve son sonuçları çizer.
+    """
+
+    def __init__(self, key: str, label: str = ""):
+        self.key = key
+        self.label = label
+        self.started_at = time.time()
+        self.partial: List[Dict] = []
+        self.cancelled = threading.Event()
+        self.future: Future = None
+
+    def cancel(self):
+        """Aramayı iptal et (başlamadıysa hiç çalışmaz)"""
+        self.cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def elapsed(self) -> float:
+        return time.time() - self.started_at
+
+    def result(self) -> Any:
+        """İşçinin dönüş değeri (hata olduysa yeniden fırlatılır)"""
+        return self.future.result()
+
+
+class SearchRunner:
+    """Aramaları Streamlit betik thread'i dışında çalıştıran havuz (süreç başına bir tane)"""
+
+    def __init__(self, max_workers: int = 8):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+
+    def submit(self, key: str, fn: Callable[[SearchTask], Any], label: str = "") -> SearchTask:
+        """fn(task) fonksiyonunu arka planda başlat, görevi hemen döndür"""
+
+        task = SearchTask(key, label)
+        task.future = self._executor.submit(fn, task)
+        return task
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Test
+if __name__ == "__main__":
+    def slow_search(task):
+        for i in range(20):
+            if task.cancelled.is_set():
+                return task.partial
+            time.sleep(0.05)
+            task.partial.append({"id": str(i)})
+        return task.partial
+
+    runner = SearchRunner()
+
+    first = runner.submit("a", slow_search)
+    time.sleep(0.2)
+    first.cancel()
+    second = runner.submit("b", slow_search)
+
+    while not second.done():
+        print(f"⏳ {len(second.partial)} ilan...")
+        time.sleep(0.25)
+
+    print(f"✅ İptal edilen: {len(first.result())} ilan, tamamlanan: {len(second.result())} ilan")
+    runner.shutdown()
@@ -0,0 +1,29 @@
+import re
+import unicodedata
+from typing import List
+
+# Türkçe büyük/küçük harf dönüşümü: I -> ı, İ -> i (str.lower() "İ"yi "i̇" yapar)
+_TR_LOWER = str.maketrans({"I": "ı", "İ": "i"})
+
+# Aksan/Türkçe harf katlama: "İstanbul" ve "Istanbul" aynı anahtara düşsün
+_TR_FOLD = str.maketrans({"ı": "i", "ş": "s", "ğ": "g", "ü": "u", "ö": "o", "ç": "c"})
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def turkish_lower(text: str) -> str:
+    """Türkçe kurallarıyla küçük harfe çevir"""
+    return (text or "").translate(_TR_LOWER).lower()
+
+
+def fold(text: str) -> str:
+    """Küçük harfe çevir ve Türkçe/aksanlı harfleri ASCII karşılığına indir"""
+
+    text = turkish_lower(text).translate(_TR_FOLD)
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni katlanmış kelimelere böl"""
+    return _TOKEN_RE.findall(fold(text))
@@ -1,14 +1,30 @@
+import copy
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Callable, Iterator, Optional, Dict, List
 
 class UserManager:
     """Kullanıcı kayıt ve profil yönetimi"""
     
+    # Profil güncellemelerini dinleyenler (ör. öneri önbelleği): fn(email, profile)
+    profile_listeners: List[Callable] = []
+    
     def __init__(self, data_file="data/users.json"):
         self.data_file = data_file
+        self._file_version = self._stat_file()
         self.users = self._load_users()
+        # Streamlit oturumları aynı örneği paylaşır; yazmalar sıraya girsin
+        self._lock = threading.RLock()
+    
+    def _stat_file(self):
+        """Dosyanın (mtime, boyut) sürümü; dosya yoksa None"""
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
     
     def _load_users(self) -> Dict:
         """Kullanıcıları dosyadan yükle"""
@@ -17,32 +33,78 @@ class UserManager:
                 return json.load(f)
         return {}
     
+    def _reload_if_changed(self):
+        """Dosya başka bir süreçte (ör. cli.py import-students) değiştiyse yeniden yükle
+        
+        Yazmadan önce çağrılır; aksi halde bellekteki eski liste kaydedilip
+        dışarıda eklenen kullanıcılar silinir.
+        """
+        with self._lock:
+            version = self._stat_file()
+            if version != self._file_version:
+                self.users = self._load_users()
+                self._file_version = version
+    
     def _save_users(self):
-        """Kullanıcıları dosyaya kaydet"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(self.users, f, ensure_ascii=False, indent=2)
+        """Kullanıcıları dosyaya kaydet (geçici dosya + rename: okuyan süreç yarım dosya görmez)"""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.data_file) or ".", exist_ok=True)
+            tmp_file = f"{self.data_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.users, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.data_file)
+            self._file_version = self._stat_file()
     
     def create_user(self, email: str, name: str, profile_data: Dict) -> bool:
         """Yeni kullanıcı oluştur"""
         
-        if email in self.users:
-            return False  # Kullanıcı zaten var
-        
-        user_id = f"U{len(self.users) + 1:03d}"
-        
-        self.users[email] = {
-            "id": user_id,
-            "email": email,
-            "name": name,
-            "created_at": datetime.now().isoformat(),
-            "profile": profile_data,
-            "application_history": []
-        }
-        
-        self._save_users()
+        with self._lock:
+            self._reload_if_changed()
+            if email in self.users:
+                return False  # Kullanıcı zaten var
+            
+            user_id = f"U{len(self.users) + 1:03d}"
+            now = datetime.now().isoformat()
+            
+            self.users[email] = {
+                "id": user_id,
+                "email": email,
+                "name": name,
+                "created_at": now,
+                "updated_at": now,  # Artımlı export için son değişiklik zamanı
+                "profile": profile_data,
+                "application_history": []
+            }
+            
+            self._save_users()
         return True
     
+    def create_users(self, users: List[Dict]) -> int:
+        """Toplu kullanıcı oluştur (email, name, profile), dosyaya tek seferde yaz; eklenen sayısını döndür"""
+        
+        created = 0
+        with self._lock:
+            self._reload_if_changed()
+            now = datetime.now().isoformat()
+            for user in users:
+                if user["email"] in self.users:
+                    continue
+                
+                self.users[user["email"]] = {
+                    "id": f"U{len(self.users) + 1:03d}",
+                    "email": user["email"],
+                    "name": user["name"],
+                    "created_at": now,
+                    "updated_at": now,
+                    "profile": user["profile"],
+                    "application_history": []
+                }
+                created += 1
+            
+            if created:
+                self._save_users()
+        return created
+    
     def get_user(self, email: str) -> Optional[Dict]:
         """Kullanıcı bilgilerini getir"""
         return self.users.get(email)
@@ -50,32 +112,54 @@ class UserManager:
     def update_profile(self, email: str, profile_data: Dict) -> bool:
         """Kullanıcı profilini güncelle"""
         
-        if email not in self.users:
-            return False
+        with self._lock:
+            self._reload_if_changed()
+            if email not in self.users:
+                return False
+            
+            self.users[email]["profile"].update(profile_data)
+            self.users[email]["updated_at"] = datetime.now().isoformat()
+            self._save_users()
         
-        self.users[email]["profile"].update(profile_data)
-        self._save_users()
+        for listener in list(UserManager.profile_listeners):
+            listener(email, self.users[email]["profile"])
         return True
     
     def add_application(self, email: str, job_id: str, job_title: str):
         """Başvuru geçmişine ekle"""
         
-        if email not in self.users:
-            return False
-        
-        application = {
-            "job_id": job_id,
-            "job_title": job_title,
-            "applied_at": datetime.now().isoformat()
-        }
-        
-        self.users[email]["application_history"].append(application)
-        self._save_users()
+        with self._lock:
+            self._reload_if_changed()
+            if email not in self.users:
+                return False
+            
+            application = {
+                "job_id": job_id,
+                "job_title": job_title,
+                "applied_at": datetime.now().isoformat()
+            }
+            
+            self.users[email]["application_history"].append(application)
+            self.users[email]["updated_at"] = application["applied_at"]
+            self._save_users()
         return True
     
     def get_all_users(self) -> List[Dict]:
         """Tüm kullanıcıları listele"""
         return list(self.users.values())
+    
+    def snapshot_users(self) -> List[Dict]:
+        """Kullanıcıların kilit altında alınmış derin kopyası (arka plan thread'leri için)"""
+        with self._lock:
+            self._reload_if_changed()
+            return copy.deepcopy(list(self.users.values()))
+    
+    def iter_users(self) -> Iterator[Dict]:
+        """Kullanıcıları kopya liste kurmadan sırayla üret (akış halinde export için)"""
+        for email in list(self.users):
+            user = self.users.get(email)
+            if user is not None:
+                yield user
 
 
 def create_user_profile_template():
@@ -120,6 +204,27 @@ def create_user_profile_template():
     }
 
 
+def profile_from_student(student: Dict) -> Dict:
+    """data/students.json kaydını kullanıcı profiline çevir"""
+    
+    preferences = student.get("preferences", {})
+    profile = create_user_profile_template()
+    profile.update({
+        "age": student.get("age"),
+        "city": student.get("city", ""),
+        "district": student.get("district", ""),
+        "location": student.get("location") or profile["location"],
+        "skills": student.get("skills", []),
+        "gpa": student.get("gpa"),
+        "available_hours": student.get("available_hours", []),
+        "experience_months": student.get("experience_months", 0),
+        "preferred_categories": preferences.get("preferred_categories", []),
+        "min_hourly_wage": preferences.get("min_hourly_wage"),
+        "max_distance_km": preferences.get("max_distance_km"),
+    })
+    return profile
+
+
 # Test
 if __name__ == "__main__":
     manager = UserManager()